@@ -0,0 +1,158 @@
+"""
+Local stand-in for the OpenAI API, for load testing without spending credit.
+
+Serves chat completions (including streaming), speech, transcriptions and
+embeddings with configurable latency distributions. Point the backend at it
+with OPENAI_BASE_URL=http://127.0.0.1:9100/v1.
+
+Usage:
+    python -m benchmarks.fake_openai --port 9100 --chat-latency lognormal:1.5,0.4
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+from typing import Callable
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import Response, StreamingResponse
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """Build a latency sampler (seconds) from "fixed:S", "uniform:A,B" or "lognormal:MEDIAN,SIGMA"."""
+    kind, _, params = spec.partition(":")
+    values = [float(value) for value in params.split(",") if value]
+    if kind == "fixed":
+        return lambda: values[0]
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1])
+    if kind == "lognormal":
+        median, sigma = values
+        return lambda: random.lognormvariate(np.log(median), sigma)
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+CANNED_REPLY = (
+    "Thanks for reaching out! I have several years of experience building production "
+    "machine learning systems. I'm authorized to work in the US and can start with two "
+    "weeks' notice. What does the team's roadmap look like for the next year?"
+)
+
+
+def create_app(
+    chat_latency: Callable[[], float],
+    token_interval: float,
+    speech_latency: Callable[[], float],
+    transcription_latency: Callable[[], float],
+    embedding_latency: Callable[[], float],
+    embedding_dim: int = 1536
+) -> FastAPI:
+    """Build the fake API app with the given latency samplers."""
+    app = FastAPI(title="Fake OpenAI")
+    
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        model = body.get("model", "gpt-4")
+        
+        if not body.get("stream"):
+            await asyncio.sleep(chat_latency())
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": CANNED_REPLY},
+                    "finish_reason": "stop"
+                }],
+                "usage": {
+                    "prompt_tokens": sum(len(m["content"]) // 4 for m in body["messages"]),
+                    "completion_tokens": len(CANNED_REPLY) // 4,
+                    "total_tokens": 0
+                }
+            }
+        
+        async def stream():
+            # Time to first token is drawn from the chat distribution
+            await asyncio.sleep(chat_latency())
+            for word in CANNED_REPLY.split(" "):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}]
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+                await asyncio.sleep(token_interval)
+            yield "data: [DONE]\n\n"
+        
+        return StreamingResponse(stream(), media_type="text/event-stream")
+    
+    @app.post("/v1/audio/speech")
+    async def speech(request: Request):
+        body = await request.json()
+        await asyncio.sleep(speech_latency())
+        # One silent MP3 frame per ~40 characters of input
+        frame = b"\xff\xfb\x90\x64" + b"\x00" * 413
+        return Response(content=frame * max(1, len(body.get("input", "")) // 40), media_type="audio/mpeg")
+    
+    @app.post("/v1/audio/transcriptions")
+    async def transcriptions(file: UploadFile = File(...), model: str = Form("whisper-1")):
+        size = len(await file.read())
+        await asyncio.sleep(transcription_latency())
+        return {"text": f"Transcribed {size} bytes of audio."}
+    
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        await asyncio.sleep(embedding_latency())
+        data = []
+        for index, text in enumerate(inputs):
+            # Deterministic per text, so caches keyed on similarity behave realistically
+            seed = int.from_bytes(hashlib.sha256(str(text).encode("utf-8")).digest()[:8], "little")
+            vector = np.random.default_rng(seed).standard_normal(embedding_dim).astype(np.float32)
+            data.append({"object": "embedding", "index": index, "embedding": (vector / np.linalg.norm(vector)).tolist()})
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model"),
+            "usage": {"prompt_tokens": 0, "total_tokens": 0}
+        }
+    
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--chat-latency", default="lognormal:1.5,0.4", help="time to full reply / first token")
+    parser.add_argument("--token-interval", type=float, default=0.02, help="seconds between streamed tokens")
+    parser.add_argument("--speech-latency", default="lognormal:0.8,0.3")
+    parser.add_argument("--transcription-latency", default="lognormal:1.0,0.3")
+    parser.add_argument("--embedding-latency", default="lognormal:0.1,0.3")
+    args = parser.parse_args()
+    
+    app = create_app(
+        chat_latency=parse_latency(args.chat_latency),
+        token_interval=args.token_interval,
+        speech_latency=parse_latency(args.speech_latency),
+        transcription_latency=parse_latency(args.transcription_latency),
+        embedding_latency=parse_latency(args.embedding_latency)
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Load benchmark for the AI Persona API.
+
+Drives /conversation, /voice/synthesize, /voice/transcribe and
+/knowledge/search at a fixed concurrency and reports p50/p95/p99 latency
+and throughput per scenario. Run it against a backend started with
+OPENAI_BASE_URL pointing at benchmarks.fake_openai to avoid API spend.
+
+Every request carries a unique reference so the FAQ fast path and the
+semantic, TTS and search caches miss and the full pipeline is measured;
+pass --repeat-inputs to measure cache hits instead. Mock fallbacks (which
+return 200) are read from /metrics and reported per scenario.
+
+Usage:
+    python -m benchmarks.run_benchmark --base-url http://127.0.0.1:8000 \\
+        --concurrency 32 --requests 500 --scenarios conversation,search
+"""
+import argparse
+import asyncio
+import io
+import itertools
+import math
+import random
+import re
+import struct
+import time
+import uuid
+import wave
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+
+# Deliberately not the canonical FAQ questions, so they go to the model
+QUESTIONS = [
+    "Walk me through how you would design a feature store for a small ML team.",
+    "Which parts of your last role would you keep doing, and which would you drop?",
+    "How do you decide when a model is good enough to ship?",
+    "What does your debugging process look like for a flaky data pipeline?",
+    "Tell me about a challenging project you worked on.",
+    "What kind of team are you hoping to join next?",
+    "How much experience do you have with cloud platforms?",
+    "How do you keep up with new research without losing focus on delivery?"
+]
+
+MOCK_FALLBACKS_RE = re.compile(r'^ai_persona_mock_fallbacks_total\{[^}]*\}\s+(\S+)$', re.MULTILINE)
+
+
+def make_wav(seconds: float = 5.0, rate: int = 16000) -> bytes:
+    """A mono 16-bit tone with pauses, for transcription requests."""
+    frames = bytearray()
+    for i in range(int(seconds * rate)):
+        # 1 s of tone followed by 0.5 s of silence, repeating
+        audible = (i % int(1.5 * rate)) < rate
+        sample = int(8000 * math.sin(2 * math.pi * 220 * i / rate)) if audible else 0
+        frames += struct.pack("<h", sample)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(bytes(frames))
+    return buffer.getvalue()
+
+
+def build_scenarios(
+    audio_seconds: float, 
+    repeat_inputs: bool = False
+) -> Dict[str, Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]]:
+    """Request functions for each benchmarked endpoint."""
+    wav = make_wav(audio_seconds)
+    run_id = uuid.uuid4().hex[:8]
+    counter = itertools.count()
+    
+    def question() -> str:
+        text = random.choice(QUESTIONS)
+        if repeat_inputs:
+            return text
+        return f"Reference {run_id}-{next(counter)}. {text}"
+    
+    async def conversation(client: httpx.AsyncClient):
+        return await client.post("/conversation", json={"message": question()})
+    
+    async def synthesize(client: httpx.AsyncClient):
+        text = " ".join(question() for _ in range(3))
+        async with client.stream("POST", "/voice/synthesize", json={"text": text}) as response:
+            async for _ in response.aiter_bytes():
+                pass
+            return response
+    
+    async def transcribe(client: httpx.AsyncClient):
+        return await client.post("/voice/transcribe", files={"audio_file": ("sample.wav", wav, "audio/wav")})
+    
+    async def search(client: httpx.AsyncClient):
+        return await client.get("/knowledge/search", params={"query": question(), "limit": 5})
+    
+    return {
+        "conversation": conversation,
+        "synthesize": synthesize,
+        "transcribe": transcribe,
+        "search": search
+    }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, request_fn, total: int, concurrency: int) -> Dict[str, float]:
+    """Issue `total` requests from `concurrency` workers and summarize latencies."""
+    latencies: List[float] = []
+    errors = 0
+    remaining = total
+    
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await request_fn(client)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99)
+    }
+
+
+async def mock_fallbacks(client: httpx.AsyncClient) -> float:
+    """Total mock fallbacks so far, from the backend's /metrics (NaN if unavailable)."""
+    try:
+        response = await client.get("/metrics")
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return float("nan")
+    return sum(float(value) for value in MOCK_FALLBACKS_RE.findall(response.text))
+
+
+def print_report(results: Dict[str, Dict[str, float]], concurrency: int):
+    print(f"\nconcurrency={concurrency}")
+    print(
+        f"{'scenario':<14}{'requests':>10}{'errors':>8}{'mocks':>8}"
+        f"{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for name, stats in results.items():
+        print(
+            f"{name:<14}{stats['requests']:>10}{stats['errors']:>8}{stats['mock_fallbacks']:>8.0f}"
+            f"{stats['rps']:>10.1f}{stats['p50'] * 1000:>10.1f}{stats['p95'] * 1000:>10.1f}{stats['p99'] * 1000:>10.1f}"
+        )
+
+
+async def main_async(args):
+    scenarios = build_scenarios(args.audio_seconds, args.repeat_inputs)
+    selected = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(selected) - set(scenarios)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        results = {}
+        for name in selected:
+            if args.warmup:
+                await run_scenario(client, scenarios[name], args.warmup, min(args.warmup, args.concurrency))
+            mocks_before = await mock_fallbacks(client)
+            results[name] = await run_scenario(client, scenarios[name], args.requests, args.concurrency)
+            # Mock replies are 200s, so count them separately from errors
+            results[name]["mock_fallbacks"] = await mock_fallbacks(client) - mocks_before
+    print_report(results, args.concurrency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured requests per scenario")
+    parser.add_argument("--scenarios", default="conversation,synthesize,transcribe,search")
+    parser.add_argument("--audio-seconds", type=float, default=5.0, help="length of the transcription sample")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument(
+        "--repeat-inputs", action="store_true",
+        help="reuse the same texts so FAQ and cache hits are measured instead of the full pipeline"
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
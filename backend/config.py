@@ -2,7 +2,7 @@
 Configuration settings for the AI Persona application.
 """
 import os
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -14,6 +14,11 @@ class Settings(BaseSettings):
     openai_api_key: str = Field(..., env="OPENAI_API_KEY")
     openai_model: str = Field(default="gpt-4", env="OPENAI_MODEL")
     openai_embedding_model: str = Field(default="text-embedding-ada-002", env="OPENAI_EMBEDDING_MODEL")
+    openai_base_url: Optional[str] = Field(default=None, env="OPENAI_BASE_URL")
+    openai_timeout: float = Field(default=60.0, env="OPENAI_TIMEOUT")
+    openai_max_retries: int = Field(default=2, env="OPENAI_MAX_RETRIES")
+    openai_max_connections: int = Field(default=100, env="OPENAI_MAX_CONNECTIONS")
+    openai_max_keepalive_connections: int = Field(default=20, env="OPENAI_MAX_KEEPALIVE_CONNECTIONS")
     
     # Application Configuration
     app_name: str = Field(default="AI Persona", env="APP_NAME")
@@ -21,13 +26,52 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, env="DEBUG")
     host: str = Field(default="0.0.0.0", env="HOST")
     port: int = Field(default=8000, env="PORT")
+    startup_warm_up: bool = Field(default=True, env="STARTUP_WARM_UP")
     
     # Database Configuration
     database_url: str = Field(default="sqlite:///./ai_persona.db", env="DATABASE_URL")
     redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
     
+    # Conversation Storage
+    conversation_backend: str = Field(default="memory", env="CONVERSATION_BACKEND")  # memory | redis | sql
+    conversation_history_limit: int = Field(default=50, env="CONVERSATION_HISTORY_LIMIT")
+    history_token_budget: int = Field(default=1500, env="HISTORY_TOKEN_BUDGET")
+    history_summary_enabled: bool = Field(default=True, env="HISTORY_SUMMARY_ENABLED")
+    history_summary_model: str = Field(default="gpt-3.5-turbo", env="HISTORY_SUMMARY_MODEL")
+    history_summary_max_tokens: int = Field(default=200, env="HISTORY_SUMMARY_MAX_TOKENS")
+    conversation_max_count: int = Field(default=1000, env="CONVERSATION_MAX_COUNT")
+    conversation_ttl_seconds: int = Field(default=3600, env="CONVERSATION_TTL_SECONDS")
+    conversation_janitor_interval: int = Field(default=60, env="CONVERSATION_JANITOR_INTERVAL")
+    conversation_flush_interval_ms: int = Field(default=250, env="CONVERSATION_FLUSH_INTERVAL_MS")
+    conversation_flush_batch_size: int = Field(default=100, env="CONVERSATION_FLUSH_BATCH_SIZE")
+    
     # Vector Database
     chroma_persist_directory: str = Field(default="./data/chroma_db", env="CHROMA_PERSIST_DIRECTORY")
+    knowledge_index_backend: str = Field(default="chroma", env="KNOWLEDGE_INDEX_BACKEND")  # chroma | numpy
+    vector_index_directory: str = Field(default="./data/vector_index", env="VECTOR_INDEX_DIRECTORY")
+    knowledge_batch_size: int = Field(default=64, env="KNOWLEDGE_BATCH_SIZE")
+    knowledge_search_cache_size: int = Field(default=256, env="KNOWLEDGE_SEARCH_CACHE_SIZE")
+    knowledge_reload_interval: float = Field(default=5.0, env="KNOWLEDGE_RELOAD_INTERVAL")  # 0 disables the watcher
+    
+    # Embeddings
+    embedding_cache_dir: str = Field(default="./data/embedding_cache", env="EMBEDDING_CACHE_DIR")
+    embedding_cache_max_entries: int = Field(default=20000, env="EMBEDDING_CACHE_MAX_ENTRIES")
+    embedding_batch_size: int = Field(default=256, env="EMBEDDING_BATCH_SIZE")
+    embedding_max_parallel: int = Field(default=4, env="EMBEDDING_MAX_PARALLEL")
+    
+    # Retrieval-Augmented Prompting
+    rag_enabled: bool = Field(default=False, env="RAG_ENABLED")
+    rag_top_k: int = Field(default=4, env="RAG_TOP_K")
+    rag_token_budget: int = Field(default=800, env="RAG_TOKEN_BUDGET")
+    
+    # Curated FAQ Fast Path
+    faq_fast_path_enabled: bool = Field(default=True, env="FAQ_FAST_PATH_ENABLED")
+    faq_match_threshold: float = Field(default=0.8, env="FAQ_MATCH_THRESHOLD")
+    
+    # Semantic Answer Cache
+    semantic_cache_enabled: bool = Field(default=True, env="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(default=0.95, env="SEMANTIC_CACHE_THRESHOLD")
+    semantic_cache_capacity: int = Field(default=512, env="SEMANTIC_CACHE_CAPACITY")
     
     # Security
     secret_key: str = Field(..., env="SECRET_KEY")
@@ -40,6 +84,17 @@ class Settings(BaseSettings):
     voice_model: str = Field(default="alloy", env="VOICE_MODEL")
     voice_speed: float = Field(default=1.0, env="VOICE_SPEED")
     voice_pitch: float = Field(default=1.0, env="VOICE_PITCH")
+    tts_model: str = Field(default="tts-1", env="TTS_MODEL")
+    tts_cache_dir: str = Field(default="./data/tts_cache", env="TTS_CACHE_DIR")
+    tts_cache_max_mb: int = Field(default=500, env="TTS_CACHE_MAX_MB")
+    tts_max_parallel: int = Field(default=4, env="TTS_MAX_PARALLEL")
+    stt_max_upload_mb: int = Field(default=25, env="STT_MAX_UPLOAD_MB")
+    stt_segment_seconds: int = Field(default=30, env="STT_SEGMENT_SECONDS")
+    stt_min_silence_ms: int = Field(default=500, env="STT_MIN_SILENCE_MS")
+    stt_max_parallel: int = Field(default=4, env="STT_MAX_PARALLEL")
+    stt_engine: str = Field(default="api", env="STT_ENGINE")  # api | local | auto (api, local on failure)
+    local_whisper_model: str = Field(default="base", env="LOCAL_WHISPER_MODEL")
+    local_whisper_workers: int = Field(default=0, env="LOCAL_WHISPER_WORKERS")  # 0 = one per CPU
     
     # Rate Limiting
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
@@ -50,6 +105,12 @@ class Settings(BaseSettings):
     conversation_examples_path: str = Field(default="../data/conversation_examples.json")
     voice_samples_path: str = Field(default="../data/voice_samples/")
     
+    # Personas: the default persona uses the files above, others live in
+    # <personas_directory>/<persona_id>/{personal_info,conversation_examples}.json
+    default_persona: str = Field(default="default", env="DEFAULT_PERSONA")
+    personas_directory: str = Field(default="../data/personas", env="PERSONAS_DIRECTORY")
+    persona_cache_size: int = Field(default=16, env="PERSONA_CACHE_SIZE")
+    
     class Config:
         env_file = "../.env"
         case_sensitive = False
@@ -2,22 +2,26 @@
 Main FastAPI application for AI Persona.
 """
 import os
+import json
+import asyncio
 import base64
 from typing import Optional
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-import io
+from starlette.concurrency import run_in_threadpool
+from loguru import logger
 import uuid
+import time
 from datetime import datetime
 
 from config import get_settings
 from models import (
     ConversationRequest, 
     ConversationResponse, 
-    VoiceRequest, 
     VoiceResponse,
+    SpeechRequest,
     HealthCheck,
     ErrorResponse,
     ConversationMessage,
@@ -25,6 +29,9 @@ from models import (
 )
 from services.openai_service import OpenAIService
 from services.knowledge_service import KnowledgeService
+from services.persona_registry import PersonaRegistry, UnknownPersonaError
+from services.metrics import REQUEST_SECONDS, STAGE_SECONDS, render_metrics
+from services.startup import LazyService, StartupState
 
 # Initialize FastAPI app
 settings = get_settings()
@@ -34,6 +41,48 @@ app = FastAPI(
     description="AI Persona for Recruiter Conversations"
 )
 
+class RequestLatencyMiddleware:
+    """Observe total request time per route template.
+    
+    Plain ASGI rather than `@app.middleware("http")` so streaming responses are
+    timed until their final body chunk is sent, not until headers are returned.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        observed = False
+        
+        def observe():
+            nonlocal observed
+            if not observed:
+                observed = True
+                route = scope.get("route")
+                REQUEST_SECONDS.observe(
+                    time.perf_counter() - started,
+                    route.path if route is not None else "unmatched"
+                )
+        
+        async def send_wrapper(message):
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                observe()
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Disconnected clients and errors still count
+            observe()
+
+
+app.add_middleware(RequestLatencyMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -43,9 +92,119 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-openai_service = OpenAIService()
-knowledge_service = KnowledgeService()
+# Services are built on first use (or by the warm-up task) so the server can
+# start listening before chromadb, the vector index and the profile are loaded
+startup = StartupState()
+_openai_service = LazyService("openai_service", OpenAIService, startup)
+_persona_registry = LazyService("persona_registry", PersonaRegistry, startup)
+
+
+async def get_openai_service() -> OpenAIService:
+    return await _openai_service.get_async()
+
+
+async def get_persona_registry() -> PersonaRegistry:
+    return await _persona_registry.get_async()
+
+
+async def get_persona(persona_id: Optional[str]) -> KnowledgeService:
+    """Knowledge service for `persona_id`, loading it off the event loop on first use."""
+    registry = await get_persona_registry()
+    knowledge_service = registry.peek(persona_id)
+    if knowledge_service is None:
+        try:
+            knowledge_service = await run_in_threadpool(registry.get, persona_id)
+        except UnknownPersonaError:
+            raise HTTPException(status_code=404, detail=f"Unknown persona: {persona_id}")
+    return knowledge_service
+
+
+background_tasks = []
+
+
+async def _warm_up():
+    """Build the services off the event loop."""
+    try:
+        registry = await get_persona_registry()
+        with startup.phase("default_persona"):
+            await run_in_threadpool(registry.get)
+        openai_service = await get_openai_service()
+        if openai_service.local_whisper is not None:
+            with startup.phase("local_whisper"):
+                openai_service.local_whisper.warm_up()
+        startup.mark_ready()
+    except Exception as e:
+        startup.mark_failed(e)
+
+
+async def _run_janitor(interval: float):
+    """Expire idle conversations; builds the registry (and store) if nothing has yet."""
+    registry = await get_persona_registry()
+    await registry.conversation_store.run_janitor(interval)
+
+
+async def _reload_knowledge(knowledge_service: KnowledgeService, force: bool = False) -> dict:
+    """Reload a persona's profile files and pre-compile the prompt for the new snapshot."""
+    result = await run_in_threadpool(knowledge_service.reload, force)
+    if result["reloaded"]:
+        snapshot = knowledge_service.get_snapshot()
+        openai_service = await get_openai_service()
+        prompt_cache = openai_service.core_prompt_cache if settings.rag_enabled else openai_service.prompt_cache
+        prompt_cache.get_message(snapshot.personal_info, snapshot.conversation_examples)
+    return result
+
+
+async def _watch_knowledge(interval: float):
+    """Poll the loaded personas' profile files and hot-reload them when they change."""
+    while True:
+        await asyncio.sleep(interval)
+        # Only personas that are already loaded can be stale
+        if not _persona_registry.created:
+            continue
+        for knowledge_service in (await get_persona_registry()).loaded():
+            try:
+                await _reload_knowledge(knowledge_service)
+            except Exception as e:
+                logger.error(f"Knowledge reload failed for persona {knowledge_service.persona_id}: {e}")
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Start maintenance tasks and warm the services in the background so the server listens immediately."""
+    startup.mark("listening")
+    # Independent of warm-up, so expiry and hot reload run even if it is disabled or fails
+    background_tasks.append(asyncio.create_task(_run_janitor(settings.conversation_janitor_interval)))
+    if settings.knowledge_reload_interval > 0:
+        background_tasks.append(asyncio.create_task(_watch_knowledge(settings.knowledge_reload_interval)))
+    if settings.startup_warm_up:
+        background_tasks.append(asyncio.create_task(_warm_up()))
+    else:
+        startup.mark_ready()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks and release pooled connections on shutdown."""
+    for task in background_tasks:
+        task.cancel()
+    if _persona_registry.created:
+        await (await get_persona_registry()).conversation_store.close()
+    if _openai_service.created:
+        await (await get_openai_service()).close()
+
+
+def _service_status() -> dict:
+    """Current state of the backing services."""
+    default_persona = _persona_registry.get().peek() if _persona_registry.created else None
+    if default_persona is None:
+        knowledge_base = "starting"
+    else:
+        knowledge_base = "loaded" if default_persona.collection else "unavailable"
+    return {
+        "openai": "configured" if settings.openai_api_key else "missing_api_key",
+        "knowledge_base": knowledge_base,
+        "database": settings.conversation_backend
+    }
 
 
 @app.get("/", response_model=HealthCheck)
@@ -54,11 +213,7 @@ async def root():
     return HealthCheck(
         status="healthy",
         version=settings.app_version,
-        services={
-            "openai": "connected",
-            "knowledge_base": "loaded",
-            "database": "connected"
-        }
+        services=_service_status()
     )
 
 
@@ -68,80 +223,273 @@ async def health_check():
     return HealthCheck(
         status="healthy",
         version=settings.app_version,
-        services={
-            "openai": "connected",
-            "knowledge_base": "loaded",
-            "database": "connected"
-        }
+        services=_service_status()
+    )
+
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness():
+    """Readiness probe: services are built and warm, with startup phase timings."""
+    return JSONResponse(
+        status_code=200 if startup.ready else 503,
+        content={"status": "ready" if startup.ready else "starting", **startup.snapshot()}
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    """Latency histograms and counters in Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+def _check_conversation_owner(owner: Optional[str], persona_id: Optional[str]):
+    """404 unless the conversation belongs to the requested persona.
+    
+    Conversations created before personas were recorded have no owner and are accepted.
+    """
+    if owner is not None and owner != (persona_id or settings.default_persona):
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+
+def _record_user_message(request: ConversationRequest, knowledge_service: KnowledgeService):
+    """Resolve the conversation and append the recruiter's message to it.
+    
+    Blocking on network-backed stores (Redis, SQL restore), so call it from a worker thread.
+    """
+    # Get or create conversation ID
+    if request.conversation_id:
+        conversation_id = request.conversation_id
+        _check_conversation_owner(
+            knowledge_service.conversation_store.get_persona_id(conversation_id), knowledge_service.persona_id
+        )
+    else:
+        conversation_id = knowledge_service.start_conversation()
+    
+    # Get the recent conversation history
+    with STAGE_SECONDS.time("history_fetch"):
+        messages = list(knowledge_service.get_conversation_messages(
+            conversation_id, limit=settings.conversation_history_limit
+        ))
+    
+    # Add user message
+    user_message = ConversationMessage(
+        role=MessageRole.USER,
+        content=request.message
     )
+    message_count = knowledge_service.add_message(conversation_id, user_message)
+    if not message_count:
+        # Expired or evicted: answering without its history would silently fork the thread
+        raise HTTPException(status_code=404, detail="Conversation not found or expired")
+    messages.append(user_message)
+    
+    return conversation_id, messages, message_count
+
+
+async def _retrieve_context(message: str, knowledge_service: KnowledgeService):
+    """Top-k knowledge chunks for the message, or None to use the full profile prompt."""
+    if not settings.rag_enabled:
+        return None
+    results = await run_in_threadpool(knowledge_service.search_knowledge, message, settings.rag_top_k)
+    # Fall back to the full prompt if retrieval is unavailable
+    return results or None
+
+
+def _faq_metadata(faq_match: dict) -> dict:
+    """Response metadata for an answer served from the curated FAQ index."""
+    return {
+        "fast_path": True,
+        "faq_scenario": faq_match["scenario"],
+        "faq_score": faq_match["score"]
+    }
+
+
+async def _single_token(text: str):
+    yield text
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format a Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 
 @app.post("/conversation", response_model=ConversationResponse)
 async def start_conversation(request: ConversationRequest):
     """Start or continue a conversation with the AI persona."""
+    knowledge_service = await get_persona(request.persona_id)
+    openai_service = await get_openai_service()
     try:
-        # Get or create conversation ID
-        conversation_id = request.conversation_id or knowledge_service.start_conversation()
-        
-        # Get conversation history
-        messages = knowledge_service.get_conversation_messages(conversation_id)
-        
-        # Add user message
-        user_message = ConversationMessage(
-            role=MessageRole.USER,
-            content=request.message
+        conversation_id, messages, message_count = await run_in_threadpool(
+            _record_user_message, request, knowledge_service
         )
-        knowledge_service.add_message(conversation_id, user_message)
-        messages.append(user_message)
         
-        # Get personal info and examples
-        personal_info = knowledge_service.get_personal_info()
-        conversation_examples = knowledge_service.get_conversation_examples()
+        # Get personal info and examples from one snapshot, even if a reload lands mid-request
+        snapshot = knowledge_service.get_snapshot()
+        personal_info = snapshot.personal_info
+        conversation_examples = snapshot.conversation_examples
         
-        # Generate AI response
-        ai_response_text = await openai_service.generate_response(
-            messages, personal_info, conversation_examples
-        )
+        prompt_metadata = {}
+        faq_match = knowledge_service.match_faq(request.message, snapshot)
+        if faq_match:
+            # Canonical screening question: serve the curated answer directly
+            ai_response_text = faq_match["answer"]
+            prompt_metadata.update(_faq_metadata(faq_match))
+        else:
+            # Retrieve relevant knowledge when running in RAG mode
+            context = await _retrieve_context(request.message, knowledge_service)
+            
+            # Generate AI response
+            ai_response_text = await openai_service.generate_response(
+                messages, personal_info, conversation_examples,
+                context=context, metadata=prompt_metadata,
+                conversation_id=conversation_id
+            )
         
         # Add AI response to conversation
         ai_message = ConversationMessage(
             role=MessageRole.ASSISTANT,
             content=ai_response_text
         )
-        knowledge_service.add_message(conversation_id, ai_message)
+        await run_in_threadpool(knowledge_service.add_message, conversation_id, ai_message)
         
         # Generate audio if requested
         audio_url = None
         if request.include_voice:
+            # Synthesis lands in the audio cache, which /audio serves from
             audio_data = await openai_service.text_to_speech(ai_response_text)
             if audio_data:
-                # In a real implementation, you'd save this to a file and return URL
-                # For now, we'll return a placeholder
-                audio_url = f"/audio/{conversation_id}/{len(messages)}"
+                audio_url = f"/audio/{conversation_id}/{message_count}"
+                if knowledge_service.persona_id != settings.default_persona:
+                    audio_url += f"?persona_id={knowledge_service.persona_id}"
         
         return ConversationResponse(
             message=ai_response_text,
             conversation_id=conversation_id,
             audio_url=audio_url,
             metadata={
-                "message_count": len(messages),
-                "timestamp": datetime.now().isoformat()
+                "message_count": message_count,
+                "persona_id": knowledge_service.persona_id,
+                "timestamp": datetime.now().isoformat(),
+                **prompt_metadata
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing conversation: {str(e)}")
 
 
+@app.post("/conversation/stream")
+async def stream_conversation(request: ConversationRequest):
+    """Stream the AI persona's reply as Server-Sent Events."""
+    return await _stream_reply(request, voice=False)
+
+
+@app.post("/conversation/voice")
+async def stream_voice_conversation(request: ConversationRequest):
+    """Stream the reply as Server-Sent Events with spoken audio for each sentence.
+    
+    Speech for a sentence is synthesized as soon as the model finishes it, so
+    `audio` events (base64 MP3) start arriving while text is still generating.
+    """
+    return await _stream_reply(request, voice=True)
+
+
+async def _stream_reply(request: ConversationRequest, voice: bool) -> StreamingResponse:
+    """Shared implementation of the streaming conversation endpoints."""
+    knowledge_service = await get_persona(request.persona_id)
+    openai_service = await get_openai_service()
+    try:
+        conversation_id, messages, message_count = await run_in_threadpool(
+            _record_user_message, request, knowledge_service
+        )
+        snapshot = knowledge_service.get_snapshot()
+        personal_info = snapshot.personal_info
+        conversation_examples = snapshot.conversation_examples
+        faq_match = knowledge_service.match_faq(request.message, snapshot)
+        context = None if faq_match else await _retrieve_context(request.message, knowledge_service)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing conversation: {str(e)}")
+    
+    async def event_stream():
+        yield _sse_event("start", {"conversation_id": conversation_id})
+        
+        parts = []
+        prompt_metadata = {}
+        if faq_match:
+            prompt_metadata.update(_faq_metadata(faq_match))
+            tokens = _single_token(faq_match["answer"])
+        else:
+            tokens = openai_service.stream_response(
+                messages, personal_info, conversation_examples,
+                context=context, metadata=prompt_metadata,
+                conversation_id=conversation_id
+            )
+        
+        if voice:
+            events = openai_service.stream_voice(tokens)
+        else:
+            events = (("token", token) async for token in tokens)
+        
+        async for kind, payload in events:
+            if kind == "token":
+                parts.append(payload)
+                yield _sse_event("token", {"content": payload})
+            else:
+                yield _sse_event("audio", {
+                    "index": payload["index"],
+                    "text": payload["text"],
+                    "audio": base64.b64encode(payload["audio"]).decode("ascii")
+                })
+        
+        # Store the assembled reply once the stream completes
+        ai_response_text = "".join(parts).strip()
+        await run_in_threadpool(
+            knowledge_service.add_message,
+            conversation_id,
+            ConversationMessage(role=MessageRole.ASSISTANT, content=ai_response_text)
+        )
+        
+        yield _sse_event("done", {
+            "message": ai_response_text,
+            "conversation_id": conversation_id,
+            "metadata": {
+                "message_count": message_count,
+                "persona_id": knowledge_service.persona_id,
+                "timestamp": datetime.now().isoformat(),
+                **prompt_metadata
+            }
+        })
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.post("/voice/transcribe", response_model=VoiceResponse)
 async def transcribe_voice(audio_file: UploadFile = File(...)):
     """Transcribe voice to text."""
+    if audio_file.size is not None and audio_file.size > settings.stt_max_upload_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Audio file exceeds {settings.stt_max_upload_mb} MB limit"
+        )
+    
     try:
-        # Read audio file
-        audio_data = await audio_file.read()
-        
-        # Transcribe using OpenAI Whisper
-        text = await openai_service.speech_to_text(audio_data)
+        # Transcribe from the file the multipart parser already spooled, without copying it
+        text = await (await get_openai_service()).transcribe_file(
+            audio_file.file, filename=audio_file.filename or "audio.wav"
+        )
         
         return VoiceResponse(
             text=text,
@@ -149,41 +497,129 @@ async def transcribe_voice(audio_file: UploadFile = File(...)):
             language="en"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error transcribing audio: {str(e)}")
 
 
 @app.post("/voice/synthesize")
-async def synthesize_voice(request: VoiceRequest):
-    """Convert text to speech."""
+async def synthesize_voice(request: SpeechRequest):
+    """Convert text to speech, streaming audio sentence by sentence."""
     try:
-        # Generate speech
-        audio_data = await openai_service.text_to_speech(request.text)
+        openai_service = await get_openai_service()
+        audio_chunks = openai_service.stream_speech(request.text)
         
-        if not audio_data:
+        # Wait for the first segment so failures still surface as errors
+        try:
+            first_chunk = await audio_chunks.__anext__()
+        except StopAsyncIteration:
             raise HTTPException(status_code=500, detail="Failed to generate speech")
         
+        async def audio_stream():
+            yield first_chunk
+            async for chunk in audio_chunks:
+                yield chunk
+        
         # Return audio as streaming response
         return StreamingResponse(
-            io.BytesIO(audio_data),
+            audio_stream(),
             media_type="audio/mpeg",
             headers={"Content-Disposition": "attachment; filename=speech.mp3"}
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error synthesizing speech: {str(e)}")
 
 
+@app.get("/audio/{conversation_id}/{message_index}")
+async def get_message_audio(
+    conversation_id: str, 
+    message_index: int, 
+    request: Request, 
+    persona_id: Optional[str] = None
+):
+    """Serve the synthesized audio for an assistant message, with HTTP Range support."""
+    registry = await get_persona_registry()
+    conversation = await run_in_threadpool(registry.conversation_store.get, conversation_id)
+    if not conversation or not 0 <= message_index < len(conversation["messages"]):
+        raise HTTPException(status_code=404, detail="Message not found")
+    _check_conversation_owner(conversation.get("persona_id"), persona_id)
+    
+    message = conversation["messages"][message_index]
+    if message.role != MessageRole.ASSISTANT:
+        raise HTTPException(status_code=404, detail="No audio for this message")
+    
+    openai_service = await get_openai_service()
+    etag = f'"{openai_service.audio_key(message.content)}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        # Bytes depend on the voice settings, not just the URL, so always revalidate via the ETag
+        "Cache-Control": "private, no-cache",
+        "ETag": etag
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    # Served from the audio cache; synthesized on demand if missing
+    audio_data = await openai_service.text_to_speech(message.content)
+    if not audio_data:
+        raise HTTPException(status_code=500, detail="Failed to generate speech")
+    
+    byte_range = _parse_range(request.headers.get("range"), len(audio_data))
+    if byte_range is None:
+        return Response(content=audio_data, media_type="audio/mpeg", headers=headers)
+    
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(audio_data)}"
+    return Response(
+        content=audio_data[start:end + 1],
+        status_code=206,
+        media_type="audio/mpeg",
+        headers=headers
+    )
+
+
+def _parse_range(range_header: Optional[str], size: int):
+    """Parse a single `bytes=` range into inclusive (start, end), or None for the full body."""
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+    spec = range_header[len("bytes="):].split(",")[0].strip()
+    start_text, _, end_text = spec.partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = min(int(end_text), size - 1) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(end_text), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+
 @app.get("/conversation/{conversation_id}")
-async def get_conversation(conversation_id: str):
+async def get_conversation(conversation_id: str, persona_id: Optional[str] = None):
     """Get conversation history."""
     try:
-        conversation = knowledge_service.get_conversation(conversation_id)
+        registry = await get_persona_registry()
+        conversation = await run_in_threadpool(registry.conversation_store.get, conversation_id)
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
+        _check_conversation_owner(conversation.get("persona_id"), persona_id)
         
         return {
             "conversation_id": conversation_id,
+            "persona_id": conversation.get("persona_id"),
             "messages": [
                 {
                     "role": msg.role.value,
@@ -202,11 +638,48 @@ async def get_conversation(conversation_id: str):
         raise HTTPException(status_code=500, detail=f"Error retrieving conversation: {str(e)}")
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hit/rebuild counters for the in-process caches."""
+    openai_service = await get_openai_service()
+    registry = await get_persona_registry()
+    return {
+        "system_prompt": openai_service.prompt_cache.stats(),
+        "core_prompt": openai_service.core_prompt_cache.stats(),
+        "conversations": registry.conversation_store.stats(),
+        "personas": registry.stats(),
+        "knowledge_search": {
+            knowledge_service.persona_id: knowledge_service.search_cache.stats()
+            for knowledge_service in registry.loaded()
+        },
+        "tts_audio": openai_service.audio_cache.stats(),
+        "single_flight": openai_service.single_flight.stats(),
+        "history_summaries": (
+            openai_service.summarizer.stats() if openai_service.summarizer else None
+        ),
+        "semantic_answers": openai_service.semantic_cache_stats(),
+        "embeddings": openai_service.embedding_cache.stats()
+    }
+
+
 @app.get("/knowledge/search")
-async def search_knowledge(query: str, limit: int = 5):
-    """Search personal knowledge base."""
+async def search_knowledge(
+    query: str, 
+    limit: int = Query(5, ge=1), 
+    type: Optional[str] = None, 
+    section: Optional[str] = None, 
+    company: Optional[str] = None,
+    persona_id: Optional[str] = None
+):
+    """Search personal knowledge base, optionally filtered by chunk type, section or company."""
+    knowledge_service = await get_persona(persona_id)
     try:
-        results = knowledge_service.search_knowledge(query, limit)
+        filters = {
+            field: value
+            for field, value in (("type", type), ("section", section), ("company", company))
+            if value
+        }
+        results = await run_in_threadpool(knowledge_service.search_knowledge, query, limit, filters or None)
         return {
             "query": query,
             "results": results,
@@ -217,9 +690,28 @@ async def search_knowledge(query: str, limit: int = 5):
         raise HTTPException(status_code=500, detail=f"Error searching knowledge: {str(e)}")
 
 
+@app.post("/knowledge/reload")
+async def reload_knowledge(force: bool = False, persona_id: Optional[str] = None):
+    """Re-read personal_info.json and conversation_examples.json without a restart."""
+    knowledge_service = await get_persona(persona_id)
+    try:
+        return await _reload_knowledge(knowledge_service, force)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error reloading knowledge: {str(e)}")
+
+
+@app.get("/personas")
+async def list_personas():
+    """Persona IDs with profile data on disk, and which are currently loaded."""
+    registry = await get_persona_registry()
+    personas = await run_in_threadpool(registry.list_personas)
+    return {"personas": personas, "default": settings.default_persona, **registry.stats()}
+
+
 @app.get("/personal-info")
-async def get_personal_info():
+async def get_personal_info(persona_id: Optional[str] = None):
     """Get personal information (sanitized for privacy)."""
+    knowledge_service = await get_persona(persona_id)
     try:
         personal_info = knowledge_service.get_personal_info()
         
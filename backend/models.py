@@ -2,7 +2,7 @@
 Data models for the AI Persona application.
 """
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 from enum import Enum
 
@@ -20,12 +20,14 @@ class ConversationMessage(BaseModel):
     content: str
     timestamp: datetime = Field(default_factory=datetime.now)
     metadata: Optional[Dict[str, Any]] = None
+    _token_count: Optional[int] = PrivateAttr(default=None)  # cached by services.history
 
 
 class ConversationRequest(BaseModel):
     """Request to start or continue a conversation."""
     message: str
     conversation_id: Optional[str] = None
+    persona_id: Optional[str] = None
     include_voice: bool = False
     context: Optional[Dict[str, Any]] = None
 
@@ -46,6 +48,11 @@ class VoiceRequest(BaseModel):
     language: str = "en"
 
 
+class SpeechRequest(BaseModel):
+    """Request to synthesize speech from text."""
+    text: str
+
+
 class VoiceResponse(BaseModel):
     """Response from voice processing."""
     text: str
@@ -0,0 +1,99 @@
+"""
+Content-addressed on-disk cache for synthesized speech.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+from loguru import logger
+
+
+def audio_cache_key(text: str, model: str, voice: str, speed: float) -> str:
+    """Stable key for a synthesis request."""
+    payload = f"{model}\x00{voice}\x00{speed:.3f}\x00{text}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Stores audio files as <dir>/<key[:2]>/<key>.mp3, pruning least recently used files past `max_bytes`."""
+    
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self.directory.glob("*/*.mp3"))
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+    
+    def path_for(self, key: str) -> Path:
+        """File location for `key` (it may not exist yet)."""
+        return self.directory / key[:2] / f"{key}.mp3"
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached audio for `key`, or None."""
+        path = self.path_for(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            # Bump mtime so prune() evicts by last use rather than by creation
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return data
+    
+    def put(self, key: str, data: bytes):
+        """Atomically write audio for `key`."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        with self._lock:
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            self._size += len(data) - replaced
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.prune()
+    
+    def prune(self):
+        """Delete least recently used files until under the size budget."""
+        with self._lock:
+            files = []
+            for path in self.directory.glob("*/*.mp3"):
+                stat = path.stat()
+                files.append((stat.st_mtime, stat.st_size, path))
+            files.sort()
+            self._size = sum(size for _, size, _ in files)
+            target = self.max_bytes * 0.9
+            for _, size, path in files:
+                if self._size <= target:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                self._size -= size
+                self.pruned += 1
+        logger.info(f"Pruned TTS cache to {self._size} bytes")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Disk usage and hit counters."""
+        return {
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "pruned": self.pruned
+        }
@@ -0,0 +1,85 @@
+"""
+Silence-aware splitting of long recordings for parallel transcription.
+"""
+import io
+from typing import BinaryIO, List, Optional, Tuple, Union
+from pydub import AudioSegment
+from pydub.silence import detect_silence
+
+
+# Whisper resamples to 16 kHz mono internally, so nothing is lost by decoding to it
+SAMPLE_RATE = 16000
+
+
+class SegmentedRecording:
+    """A decoded recording plus its cut points; segments are encoded on demand."""
+    
+    def __init__(self, audio: AudioSegment, bounds: List[Tuple[int, int]]):
+        self.audio = audio
+        self.bounds = bounds
+    
+    def __len__(self) -> int:
+        return len(self.bounds)
+    
+    def export(self, index: int) -> bytes:
+        """WAV bytes of segment `index`."""
+        start, end = self.bounds[index]
+        buffer = io.BytesIO()
+        self.audio[start:end].export(buffer, format="wav")
+        return buffer.getvalue()
+
+
+def split_recording(
+    source: Union[str, BinaryIO],
+    target_ms: int = 30000,
+    min_silence_ms: int = 500,
+    silence_offset_db: float = 16.0,
+    format: Optional[str] = None
+) -> Optional[SegmentedRecording]:
+    """Split the recording at `source` (a path or open binary file) into segments of roughly `target_ms`.
+    
+    The file is decoded straight to 16 kHz mono, which keeps a long upload
+    around a tenth of its full-rate PCM size. Cuts are placed in the middle of
+    silences so words are not split. Returns None when the recording is short
+    enough to transcribe in one piece.
+    """
+    if not isinstance(source, str):
+        source.seek(0)
+    audio = AudioSegment.from_file(source, format=format, parameters=["-ac", "1", "-ar", str(SAMPLE_RATE)])
+    if len(audio) <= target_ms * 1.5:
+        return None
+    audio = audio.set_channels(1).set_frame_rate(SAMPLE_RATE)
+    
+    silences = detect_silence(
+        audio,
+        min_silence_len=min_silence_ms,
+        silence_thresh=audio.dBFS - silence_offset_db
+    )
+    
+    cuts = []
+    segment_start = 0
+    for silence_start, silence_end in silences:
+        midpoint = (silence_start + silence_end) // 2
+        if midpoint - segment_start >= target_ms:
+            cuts.append(midpoint)
+            segment_start = midpoint
+    
+    # Hard cuts where no silence was found for too long
+    bounds = [0]
+    for cut in cuts + [len(audio)]:
+        while cut - bounds[-1] > target_ms * 2:
+            bounds.append(bounds[-1] + target_ms)
+        bounds.append(cut)
+    
+    return SegmentedRecording(
+        audio, [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    )
+
+
+def read_recording(source: Union[str, BinaryIO]) -> bytes:
+    """Raw bytes of the recording at `source` (a path or open binary file)."""
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return f.read()
+    source.seek(0)
+    return source.read()
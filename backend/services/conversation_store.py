@@ -0,0 +1,190 @@
+"""
+Conversation storage backends.
+"""
+import asyncio
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from models import ConversationMessage
+
+
+class ConversationStore(ABC):
+    """Interface for conversation storage backends."""
+    
+    @abstractmethod
+    def create(self, persona_id: Optional[str] = None) -> str:
+        """Create an empty conversation owned by `persona_id` and return its ID."""
+    
+    @abstractmethod
+    def append(self, conversation_id: str, message: ConversationMessage) -> int:
+        """Append a message and return the new message count (0 if unknown)."""
+    
+    @abstractmethod
+    def get(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Return a snapshot of the conversation, or None."""
+    
+    @abstractmethod
+    def get_messages(self, conversation_id: str, limit: Optional[int] = None) -> List[ConversationMessage]:
+        """Return the conversation's messages, optionally only the last `limit`."""
+    
+    def get_persona_id(self, conversation_id: str) -> Optional[str]:
+        """Persona that owns the conversation (None if unknown or created without one)."""
+        conversation = self.get(conversation_id)
+        return conversation.get("persona_id") if conversation else None
+    
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Backend size and eviction counters."""
+    
+    def purge_expired(self) -> int:
+        """Drop expired conversations; backends with native expiry need not override."""
+        return 0
+    
+    async def run_janitor(self, interval_seconds: float):
+        """Periodically purge expired conversations until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                purged = self.purge_expired()
+                if purged:
+                    logger.info(f"Expired {purged} idle conversations")
+            except Exception as e:
+                logger.error(f"Error purging conversations: {e}")
+    
+    async def close(self):
+        """Release backend resources."""
+
+
+class InMemoryConversationStore(ConversationStore):
+    """LRU + TTL bounded conversation store safe for use from worker threads."""
+    
+    def __init__(self, max_conversations: int = 1000, ttl_seconds: int = 3600):
+        self.max_conversations = max_conversations
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self._conversations: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.evicted_lru = 0
+        self.evicted_expired = 0
+    
+    def create(self, persona_id: Optional[str] = None) -> str:
+        conversation_id = str(uuid.uuid4())
+        now = datetime.now()
+        with self._lock:
+            self._conversations[conversation_id] = {
+                "messages": [],
+                "persona_id": persona_id,
+                "created_at": now,
+                "last_updated": now
+            }
+            self._evict_overflow()
+        return conversation_id
+    
+    def append(self, conversation_id: str, message: ConversationMessage) -> int:
+        with self._lock:
+            conversation = self._live(conversation_id)
+            if conversation is None:
+                return 0
+            conversation["messages"].append(message)
+            conversation["last_updated"] = datetime.now()
+            return len(conversation["messages"])
+    
+    def get(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conversation = self._live(conversation_id)
+            if conversation is None:
+                return None
+            return {**conversation, "messages": list(conversation["messages"])}
+    
+    def get_persona_id(self, conversation_id: str) -> Optional[str]:
+        with self._lock:
+            conversation = self._live(conversation_id)
+            return conversation.get("persona_id") if conversation else None
+    
+    def get_messages(self, conversation_id: str, limit: Optional[int] = None) -> List[ConversationMessage]:
+        with self._lock:
+            conversation = self._live(conversation_id)
+            if conversation is None:
+                return []
+            messages = conversation["messages"]
+            return list(messages[-limit:] if limit else messages)
+    
+    def load(self, conversation_id: str, conversation: Dict[str, Any]):
+        """Insert an existing conversation, e.g. one read back from durable storage."""
+        with self._lock:
+            self._conversations[conversation_id] = conversation
+            self._conversations.move_to_end(conversation_id)
+            self._evict_overflow()
+    
+    def purge_expired(self) -> int:
+        """Drop conversations idle for longer than the TTL."""
+        cutoff = datetime.now() - self.ttl
+        with self._lock:
+            expired = [
+                conversation_id
+                for conversation_id, conversation in self._conversations.items()
+                if conversation["last_updated"] < cutoff
+            ]
+            for conversation_id in expired:
+                del self._conversations[conversation_id]
+            self.evicted_expired += len(expired)
+        return len(expired)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._conversations)
+        return {
+            "backend": "memory",
+            "size": size,
+            "max_conversations": self.max_conversations,
+            "ttl_seconds": int(self.ttl.total_seconds()),
+            "evicted_lru": self.evicted_lru,
+            "evicted_expired": self.evicted_expired
+        }
+    
+    def _live(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a conversation, expiring it lazily and marking it recently used."""
+        conversation = self._conversations.get(conversation_id)
+        if conversation is None:
+            return None
+        if conversation["last_updated"] < datetime.now() - self.ttl:
+            del self._conversations[conversation_id]
+            self.evicted_expired += 1
+            return None
+        self._conversations.move_to_end(conversation_id)
+        return conversation
+    
+    def _evict_overflow(self):
+        """Evict least recently used conversations beyond the size limit."""
+        while len(self._conversations) > self.max_conversations:
+            self._conversations.popitem(last=False)
+            self.evicted_lru += 1
+
+
+def create_conversation_store(settings) -> ConversationStore:
+    """Build the conversation store selected by CONVERSATION_BACKEND."""
+    backend = settings.conversation_backend.lower()
+    if backend == "sql":
+        from services.sql_conversation_store import SQLConversationStore
+        return SQLConversationStore(
+            settings.database_url,
+            max_conversations=settings.conversation_max_count,
+            ttl_seconds=settings.conversation_ttl_seconds,
+            flush_interval_ms=settings.conversation_flush_interval_ms,
+            flush_batch_size=settings.conversation_flush_batch_size
+        )
+    if backend == "redis":
+        from services.redis_conversation_store import RedisConversationStore
+        return RedisConversationStore.from_url(
+            settings.redis_url,
+            ttl_seconds=settings.conversation_ttl_seconds
+        )
+    if backend != "memory":
+        logger.warning(f"Unknown conversation backend '{backend}', using in-memory store")
+    return InMemoryConversationStore(
+        max_conversations=settings.conversation_max_count,
+        ttl_seconds=settings.conversation_ttl_seconds
+    )
@@ -0,0 +1,151 @@
+"""
+Persistent on-disk cache of text embeddings.
+"""
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Append-only binary store of float32 vectors for one embedding model.
+    
+    The file `<directory>/<model>.bin` holds a uint32 dimension header followed
+    by fixed-size records of (32-byte SHA-256 of the text, float32[dim]). It is
+    read once on startup into an in-memory LRU of at most `max_entries`
+    vectors; new vectors are appended. Once the file holds twice that many
+    records it is rewritten with only the live entries.
+    """
+    
+    def __init__(self, directory: str, model: str, max_entries: int = 20000):
+        self.model = model
+        self.max_entries = max_entries
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model)
+        self.path = Path(directory) / f"{slug}.bin"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._vectors: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._dtype: Optional[np.dtype] = None
+        self._file_records = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compactions = 0
+        self._load()
+    
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Cached vectors in input order, None where missing."""
+        with self._lock:
+            results = []
+            for text in texts:
+                key = _digest(text)
+                vector = self._vectors.get(key)
+                if vector is not None:
+                    self._vectors.move_to_end(key)
+                results.append(vector)
+        found = sum(1 for vector in results if vector is not None)
+        self.hits += found
+        self.misses += len(results) - found
+        return results
+    
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]):
+        """Persist vectors for `texts`."""
+        if not texts or self.max_entries <= 0:
+            return
+        array = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            if self._dtype is None:
+                self._dtype = self._record_dtype(array.shape[1])
+                with open(self.path, "wb") as f:
+                    np.array([array.shape[1]], dtype="<u4").tofile(f)
+            records = np.empty(len(texts), dtype=self._dtype)
+            records["key"] = np.frombuffer(
+                b"".join(_digest(text) for text in texts), dtype=np.uint8
+            ).reshape(len(texts), 32)
+            records["vector"] = array
+            with open(self.path, "ab") as f:
+                records.tofile(f)
+            self._file_records += len(records)
+            for record in records:
+                self._vectors[record["key"].tobytes()] = record["vector"]
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+                self.evictions += 1
+            if self._file_records > 2 * self.max_entries:
+                self._compact()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters."""
+        return {
+            "model": self.model,
+            "size": len(self._vectors),
+            "max_entries": self.max_entries,
+            "file_records": self._file_records,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "compactions": self.compactions
+        }
+    
+    @staticmethod
+    def _record_dtype(dim: int) -> np.dtype:
+        # Raw bytes: an "S32" key would drop trailing NUL bytes of the digest
+        return np.dtype([("key", np.uint8, (32,)), ("vector", "<f4", (dim,))])
+    
+    def _load(self):
+        if not self.path.exists() or self.path.stat().st_size < 4:
+            return
+        with open(self.path, "rb") as f:
+            dim = int(np.fromfile(f, dtype="<u4", count=1)[0])
+            self._dtype = self._record_dtype(dim)
+            # Ignore a partially written trailing record
+            count = (self.path.stat().st_size - 4) // self._dtype.itemsize
+            records = np.fromfile(f, dtype=self._dtype, count=count)
+        self._file_records = len(records)
+        # Later records are more recent; keep the newest `max_entries`
+        for record in records[-self.max_entries:] if self.max_entries > 0 else []:
+            key = record["key"].tobytes()
+            self._vectors.pop(key, None)
+            self._vectors[key] = record["vector"]
+        if self._file_records > 2 * self.max_entries:
+            with self._lock:
+                self._compact()
+    
+    def _compact(self):
+        """Rewrite the file with only the live entries (caller holds the lock)."""
+        records = np.empty(len(self._vectors), dtype=self._dtype)
+        if len(records):
+            records["key"] = np.frombuffer(b"".join(self._vectors.keys()), dtype=np.uint8).reshape(-1, 32)
+            records["vector"] = np.stack(list(self._vectors.values()))
+        tmp = self.path.with_suffix(".bin.tmp")
+        with open(tmp, "wb") as f:
+            np.array([self._dtype["vector"].shape[0]], dtype="<u4").tofile(f)
+            records.tofile(f)
+        os.replace(tmp, self.path)
+        self._file_records = len(records)
+        self.compactions += 1
+
+
+def cached_embedder(
+    embed: Callable[[List[str]], Sequence[Sequence[float]]],
+    cache: EmbeddingCache
+) -> Callable[[List[str]], List[np.ndarray]]:
+    """Wrap a synchronous batch embedding function with `cache`."""
+    def embed_with_cache(texts: List[str]) -> List[np.ndarray]:
+        vectors = cache.get_many(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if missing:
+            fresh = np.asarray(embed(missing), dtype=np.float32)
+            cache.put_many(missing, fresh)
+            by_text = dict(zip(missing, fresh))
+            vectors = [vector if vector is not None else by_text[text] for text, vector in zip(texts, vectors)]
+        return vectors
+    return embed_with_cache
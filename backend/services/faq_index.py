@@ -0,0 +1,72 @@
+"""
+Lookup index over the curated recruiter Q&A pairs.
+"""
+import re
+from typing import Any, Dict, FrozenSet, List, Optional
+
+
+STOPWORDS = frozenset("""
+a an and are as at be can could do does for from have hi how i i'm in is it me my of on or so
+that the this to was we what when where which who why will with would you your you're
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def normalize_question(text: str) -> str:
+    """Lowercase and strip punctuation so trivially different phrasings compare equal."""
+    return " ".join(_TOKEN_RE.findall(text.lower()))
+
+
+def content_terms(text: str) -> FrozenSet[str]:
+    """Content words of a question, ignoring stopwords."""
+    return frozenset(token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS)
+
+
+class FAQIndex:
+    """Matches incoming messages against canonical recruiter questions.
+    
+    An exact match on the normalized question is a dict lookup; otherwise the
+    best Jaccard overlap of content words must reach `threshold`.
+    """
+    
+    def __init__(self, conversation_examples: Dict[str, Any], threshold: float = 0.8):
+        self.threshold = threshold
+        self.entries: List[Dict[str, Any]] = []
+        self._exact: Dict[str, Dict[str, Any]] = {}
+        
+        for example in conversation_examples.get("recruiter_conversations", []):
+            question = example.get("recruiter_question")
+            answer = example.get("ai_response")
+            if not question or not answer:
+                continue
+            entry = {
+                "scenario": example.get("scenario", ""),
+                "question": question,
+                "answer": answer,
+                "terms": content_terms(question)
+            }
+            self.entries.append(entry)
+            self._exact[normalize_question(question)] = entry
+    
+    def match(self, message: str) -> Optional[Dict[str, Any]]:
+        """Return the curated entry and score if `message` clearly matches one."""
+        entry = self._exact.get(normalize_question(message))
+        if entry is not None:
+            return {**entry, "score": 1.0}
+        
+        terms = content_terms(message)
+        if not terms:
+            return None
+        
+        best, best_score = None, 0.0
+        for entry in self.entries:
+            if not entry["terms"]:
+                continue
+            score = len(terms & entry["terms"]) / len(terms | entry["terms"])
+            if score > best_score:
+                best, best_score = entry, score
+        
+        if best is None or best_score < self.threshold:
+            return None
+        return {**best, "score": round(best_score, 4)}
@@ -0,0 +1,101 @@
+"""
+Token-budgeted history selection and rolling conversation summaries.
+"""
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+from models import ConversationMessage
+from services.tokens import count_tokens
+
+
+def message_tokens(message: ConversationMessage) -> int:
+    """Token count of a message, computed once and cached on the instance."""
+    if message._token_count is None:
+        message._token_count = count_tokens(message.content) + 4
+    return message._token_count
+
+
+def select_history(
+    messages: List[ConversationMessage], 
+    token_budget: int
+) -> Tuple[List[ConversationMessage], List[ConversationMessage]]:
+    """Split history into (recent window within budget, older messages).
+    
+    The window is filled from the newest message backwards; the latest message
+    is always kept even if it alone exceeds the budget.
+    """
+    used = 0
+    start = len(messages)
+    while start > 0:
+        tokens = message_tokens(messages[start - 1])
+        if used + tokens > token_budget and start < len(messages):
+            break
+        used += tokens
+        start -= 1
+    return messages[start:], messages[:start]
+
+
+class HistorySummarizer:
+    """Maintains a running summary of turns that fell out of the history window.
+    
+    Summaries are refreshed by background tasks, so a request never waits on
+    summarization; it uses whatever summary is available at the time.
+    """
+    
+    def __init__(self, summarize: Callable[[Optional[str], List[ConversationMessage]], Awaitable[str]], capacity: int = 1000):
+        self._summarize = summarize
+        self.capacity = capacity
+        self._summaries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.refreshes = 0
+        self.failures = 0
+    
+    def get(self, conversation_id: str) -> Optional[str]:
+        """Current summary for the conversation, if any."""
+        entry = self._summaries.get(conversation_id)
+        if entry is None:
+            return None
+        self._summaries.move_to_end(conversation_id)
+        return entry["summary"]
+    
+    def schedule(self, conversation_id: str, older: List[ConversationMessage]):
+        """Fold messages not yet covered by the summary, in the background."""
+        if not older or conversation_id in self._tasks:
+            return
+        entry = self._summaries.get(conversation_id)
+        through = entry["through"] if entry else None
+        new_messages = [m for m in older if through is None or m.timestamp > through]
+        if not new_messages:
+            return
+        previous = entry["summary"] if entry else None
+        task = asyncio.create_task(self._refresh(conversation_id, previous, new_messages))
+        self._tasks[conversation_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(conversation_id, None))
+    
+    async def _refresh(self, conversation_id: str, previous: Optional[str], new_messages: List[ConversationMessage]):
+        try:
+            summary = await self._summarize(previous, new_messages)
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Error summarizing conversation {conversation_id}: {e}")
+            return
+        self._summaries[conversation_id] = {
+            "summary": summary,
+            "through": new_messages[-1].timestamp,
+            "updated_at": datetime.now()
+        }
+        self._summaries.move_to_end(conversation_id)
+        while len(self._summaries) > self.capacity:
+            self._summaries.popitem(last=False)
+        self.refreshes += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Summary cache size and refresh counters."""
+        return {
+            "size": len(self._summaries),
+            "in_flight": len(self._tasks),
+            "refreshes": self.refreshes,
+            "failures": self.failures
+        }
@@ -2,111 +2,319 @@
 Knowledge service for managing personal information and conversation context.
 """
 import json
-import uuid
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import os
+import re
+import threading
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from loguru import logger
-import chromadb
-from chromadb.config import Settings as ChromaSettings
 from config import get_settings
 from models import PersonalInfo, ConversationExamples, ConversationMessage
+from services.conversation_store import create_conversation_store
+from services.embedding_cache import EmbeddingCache, cached_embedder
+from services.faq_index import FAQIndex
+from services.lru_cache import LRUCache
+from services.metrics import STAGE_SECONDS
+from services.prompt_cache import content_hash
+from services.vector_index import NumpyVectorIndex
+
+
+PERSONA_ID_PATTERN = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9_-]{0,53}[A-Za-z0-9])?$")
+
+
+def persona_paths(settings, persona_id: str) -> Tuple[str, str]:
+    """(personal_info, conversation_examples) JSON paths for a persona."""
+    if persona_id == settings.default_persona:
+        return settings.personal_data_path, settings.conversation_examples_path
+    directory = os.path.join(settings.personas_directory, persona_id)
+    return (
+        os.path.join(directory, "personal_info.json"),
+        os.path.join(directory, "conversation_examples.json")
+    )
+
+
+class KnowledgeResources:
+    """Process-wide handles shared by every persona's KnowledgeService.
+    
+    The conversation store, the Chroma client and the local embedding model
+    are created once, on first use, however many personas are loaded.
+    """
+    
+    def __init__(self, settings=None):
+        self.settings = settings or get_settings()
+        self._lock = threading.Lock()
+        self._chroma_client = None
+        self._embedding_function = None
+        self._embedder = None
+        self.conversation_store = create_conversation_store(self.settings)
+    
+    def chroma_client(self):
+        """Shared persistent Chroma client."""
+        with self._lock:
+            if self._chroma_client is None:
+                # Imported here: chromadb is slow to import and only needed once an index is built
+                import chromadb
+                self._chroma_client = chromadb.PersistentClient(
+                    path=self.settings.chroma_persist_directory
+                )
+            return self._chroma_client
+    
+    def embedding_function(self):
+        """Shared instance of Chroma's default embedding model."""
+        with self._lock:
+            if self._embedding_function is None:
+                from chromadb.utils import embedding_functions
+                self._embedding_function = embedding_functions.DefaultEmbeddingFunction()
+            return self._embedding_function
+    
+    def embedder(self):
+        """The default embedding model behind the persistent embedding cache."""
+        embedding_function = self.embedding_function()
+        with self._lock:
+            if self._embedder is None:
+                self._embedder = cached_embedder(
+                    embedding_function,
+                    EmbeddingCache(
+                        self.settings.embedding_cache_dir,
+                        "chroma-default",
+                        self.settings.embedding_cache_max_entries
+                    )
+                )
+            return self._embedder
+
+
+class KnowledgeSnapshot(NamedTuple):
+    """Immutable view of the profile data; replaced wholesale on reload."""
+    personal_info: Dict[str, Any]
+    conversation_examples: Dict[str, Any]
+    faq_index: FAQIndex
+    version: str
+    mtimes: Tuple[Optional[float], Optional[float]]
 
 
 class KnowledgeService:
     """Service for managing personal knowledge base and conversation context."""
     
-    def __init__(self):
+    def __init__(self, persona_id: Optional[str] = None, resources: Optional[KnowledgeResources] = None):
         self.settings = get_settings()
-        self.personal_info = self._load_personal_info()
-        self.conversation_examples = self._load_conversation_examples()
-        self.chroma_client = self._initialize_chroma()
-        self.conversations = {}  # In-memory conversation storage
+        self.persona_id = persona_id or self.settings.default_persona
+        self.resources = resources or KnowledgeResources(self.settings)
+        self.personal_data_path, self.conversation_examples_path = persona_paths(self.settings, self.persona_id)
+        self._reload_lock = threading.Lock()
+        # Stat before reading so an edit made during the read is picked up by the next reload
+        mtimes = self._source_mtimes()
+        self.snapshot = self._build_snapshot(
+            self._load_personal_info(), self._load_conversation_examples(), mtimes
+        )
+        self.search_cache = LRUCache(self.settings.knowledge_search_cache_size)
+        self.collection = self._initialize_index()
+        self.conversation_store = self.resources.conversation_store
+    
+    @property
+    def personal_info(self) -> Dict[str, Any]:
+        return self.snapshot.personal_info
+    
+    @property
+    def conversation_examples(self) -> Dict[str, Any]:
+        return self.snapshot.conversation_examples
+    
+    @property
+    def faq_index(self) -> FAQIndex:
+        return self.snapshot.faq_index
         
-    def _load_personal_info(self) -> Dict[str, Any]:
+    def _load_personal_info(self, strict: bool = False) -> Dict[str, Any]:
         """Load personal information from JSON file."""
         try:
-            with open(self.settings.personal_data_path, 'r') as f:
+            with open(self.personal_data_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
+            if strict:
+                raise
             logger.error(f"Error loading personal info: {e}")
             return {}
     
-    def _load_conversation_examples(self) -> Dict[str, Any]:
+    def _load_conversation_examples(self, strict: bool = False) -> Dict[str, Any]:
         """Load conversation examples from JSON file."""
         try:
-            with open(self.settings.conversation_examples_path, 'r') as f:
+            with open(self.conversation_examples_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
+            if strict:
+                raise
             logger.error(f"Error loading conversation examples: {e}")
             return {}
     
-    def _initialize_chroma(self) -> chromadb.ClientAPI:
-        """Initialize ChromaDB client."""
+    def _source_mtimes(self) -> Tuple[Optional[float], Optional[float]]:
+        """Modification times of the two profile files (None if missing)."""
+        mtimes = []
+        for path in (self.personal_data_path, self.conversation_examples_path):
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+    
+    def _build_snapshot(
+        self, 
+        personal_info: Dict[str, Any], 
+        conversation_examples: Dict[str, Any],
+        mtimes: Tuple[Optional[float], Optional[float]]
+    ) -> KnowledgeSnapshot:
+        return KnowledgeSnapshot(
+            personal_info=personal_info,
+            conversation_examples=conversation_examples,
+            faq_index=FAQIndex(conversation_examples, self.settings.faq_match_threshold),
+            version=content_hash(personal_info, conversation_examples),
+            mtimes=mtimes
+        )
+    
+    def reload(self, force: bool = False) -> Dict[str, Any]:
+        """Re-read the profile files and swap in a new snapshot if they changed.
+        
+        Readers never lock: they keep whichever snapshot they already fetched,
+        and the swap is a single attribute assignment. Only chunks whose content
+        changed are re-embedded. A file that fails to parse leaves the current
+        snapshot in place.
+        """
+        with self._reload_lock:
+            current = self.snapshot
+            mtimes = self._source_mtimes()
+            if not force and mtimes == current.mtimes:
+                return {"reloaded": False, "version": current.version}
+            
+            try:
+                personal_info = self._load_personal_info(strict=True)
+                conversation_examples = self._load_conversation_examples(strict=True)
+            except Exception as e:
+                logger.error(f"Keeping knowledge snapshot {current.version[:12]}: {e}")
+                return {"reloaded": False, "version": current.version, "error": str(e)}
+            
+            snapshot = self._build_snapshot(personal_info, conversation_examples, mtimes)
+            if snapshot.version == current.version:
+                # Touched but unchanged: remember the new mtimes only
+                self.snapshot = current._replace(mtimes=mtimes)
+                return {"reloaded": False, "version": current.version}
+            
+            # Index first, so searches under the new version already see the new chunks
+            index = self._sync_knowledge_base(self.collection, personal_info) if self.collection else None
+            self.snapshot = snapshot
+            logger.info(f"Reloaded knowledge snapshot {snapshot.version[:12]}")
+            return {"reloaded": True, "version": snapshot.version, "index": index}
+    
+    def _initialize_index(self):
+        """Open the configured vector index and bring it in line with the personal data."""
+        if self.settings.knowledge_index_backend == "numpy":
+            collection = self._initialize_numpy_index()
+        else:
+            collection = self._initialize_chroma()
+        
+        if collection is not None:
+            self._sync_knowledge_base(collection, self.personal_info)
+        
+        # Keep the handle open for searches
+        return collection
+    
+    def _initialize_chroma(self):
+        """Return this persona's knowledge collection from the shared Chroma client."""
         try:
-            client = chromadb.PersistentClient(
-                path=self.settings.chroma_persist_directory
-            )
+            # The default persona keeps the original collection name
+            if self.persona_id == self.settings.default_persona:
+                name = "personal_knowledge"
+            else:
+                name = f"persona_{self.persona_id}"
             
             # Create or get collection
-            collection = client.get_or_create_collection(
-                name="personal_knowledge",
+            return self.resources.chroma_client().get_or_create_collection(
+                name=name,
+                embedding_function=self.resources.embedding_function(),
                 metadata={"description": "Personal information for AI persona"}
             )
-            
-            # Initialize with personal data if collection is empty
-            if collection.count() == 0:
-                self._populate_knowledge_base(collection)
-            
-            return client
         except Exception as e:
             logger.error(f"Error initializing ChromaDB: {e}")
             return None
     
-    def _populate_knowledge_base(self, collection):
-        """Populate the knowledge base with personal information."""
+    def _initialize_numpy_index(self) -> Optional[NumpyVectorIndex]:
+        """Initialize the in-process NumPy index with Chroma's default embedding model."""
         try:
-            # Convert personal info to searchable chunks
-            chunks = self._create_knowledge_chunks()
+            directory = self.settings.vector_index_directory
+            if self.persona_id != self.settings.default_persona:
+                directory = os.path.join(directory, "personas", self.persona_id)
+            return NumpyVectorIndex(
+                directory, self.resources.embedder(), embed_query=self.resources.embedding_function()
+            )
+        except Exception as e:
+            logger.error(f"Error initializing vector index: {e}")
+            return None
+    
+    def _sync_knowledge_base(self, collection, personal_info: Dict[str, Any]) -> Dict[str, int]:
+        """Idempotently upsert new chunks and delete stale ones, in batches."""
+        try:
+            # Stable content-hash IDs: unchanged chunks keep their ID and are skipped
+            chunks = {
+                content_hash(chunk["content"], chunk["metadata"]): chunk
+                for chunk in self._create_knowledge_chunks(personal_info)
+            }
+            existing_ids = set(collection.get(include=[])["ids"])
+            
+            new_ids = [chunk_id for chunk_id in chunks if chunk_id not in existing_ids]
+            stale_ids = [chunk_id for chunk_id in existing_ids if chunk_id not in chunks]
             
-            # Add chunks to collection
-            for i, chunk in enumerate(chunks):
-                collection.add(
-                    documents=[chunk["content"]],
-                    metadatas=[chunk["metadata"]],
-                    ids=[f"chunk_{i}"]
+            # Embed through the persistent cache so rebuilding an index re-embeds only new text
+            embed = self.resources.embedder()
+            batch_size = self.settings.knowledge_batch_size
+            for start in range(0, len(new_ids), batch_size):
+                batch = new_ids[start:start + batch_size]
+                documents = [chunks[chunk_id]["content"] for chunk_id in batch]
+                collection.upsert(
+                    ids=batch,
+                    documents=documents,
+                    metadatas=[chunks[chunk_id]["metadata"] for chunk_id in batch],
+                    embeddings=embed(documents)
                 )
             
-            logger.info(f"Added {len(chunks)} knowledge chunks to database")
+            if stale_ids:
+                collection.delete(ids=stale_ids)
+            
+            if new_ids or stale_ids:
+                self.search_cache.clear()
+            
+            summary = {
+                "added": len(new_ids),
+                "removed": len(stale_ids),
+                "unchanged": len(chunks) - len(new_ids)
+            }
+            logger.info(f"Synced knowledge base: {summary}")
+            return summary
         except Exception as e:
-            logger.error(f"Error populating knowledge base: {e}")
+            logger.error(f"Error syncing knowledge base: {e}")
+            return {"added": 0, "removed": 0, "unchanged": 0}
     
-    def _create_knowledge_chunks(self) -> List[Dict[str, Any]]:
+    def _create_knowledge_chunks(self, personal_info: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create searchable chunks from personal information."""
         chunks = []
         
         # Personal details chunk
-        personal_details = self.personal_info.get("personal_details", {})
+        personal_details = personal_info.get("personal_details", {})
         chunks.append({
             "content": f"Personal Information: Name is {personal_details.get('name', 'Not specified')}, located in {personal_details.get('location', 'Not specified')}, contact email {personal_details.get('email', 'Not specified')}, phone {personal_details.get('phone', 'Not specified')}",
             "metadata": {"type": "personal_details", "section": "contact_info"}
         })
         
         # Work authorization chunk
-        work_auth = self.personal_info.get("work_authorization", {})
+        work_auth = personal_info.get("work_authorization", {})
         chunks.append({
             "content": f"Work Authorization: {work_auth.get('status', 'Not specified')}, visa type {work_auth.get('visa_type', 'Not specified')}, sponsorship required {work_auth.get('sponsorship_required', 'Not specified')}, relocation willingness {work_auth.get('relocation_willingness', 'Not specified')}, remote preference {work_auth.get('remote_preference', 'Not specified')}",
             "metadata": {"type": "work_authorization", "section": "legal_status"}
         })
         
         # Professional summary chunk
-        prof_summary = self.personal_info.get("professional_summary", {})
+        prof_summary = personal_info.get("professional_summary", {})
         chunks.append({
             "content": f"Professional Summary: {prof_summary.get('title', 'Not specified')} with {prof_summary.get('years_experience', 'Not specified')} years of experience. {prof_summary.get('summary', 'Not specified')}. Key skills: {', '.join(prof_summary.get('key_skills', []))}",
             "metadata": {"type": "professional_summary", "section": "overview"}
         })
         
         # Work experience chunks
-        work_exp = self.personal_info.get("work_experience", [])
+        work_exp = personal_info.get("work_experience", [])
         for i, job in enumerate(work_exp):
             chunks.append({
                 "content": f"Work Experience {i+1}: {job.get('position', 'Not specified')} at {job.get('company', 'Not specified')} from {job.get('duration', 'Not specified')}. {job.get('description', 'Not specified')}. Key achievements: {', '.join(job.get('key_achievements', []))}. Technologies used: {', '.join(job.get('technologies', []))}",
@@ -114,7 +322,7 @@ class KnowledgeService:
             })
         
         # Education chunks
-        education = self.personal_info.get("education", [])
+        education = personal_info.get("education", [])
         for i, edu in enumerate(education):
             chunks.append({
                 "content": f"Education {i+1}: {edu.get('degree', 'Not specified')} from {edu.get('institution', 'Not specified')} in {edu.get('graduation_year', 'Not specified')}. GPA: {edu.get('gpa', 'Not specified')}. Relevant coursework: {', '.join(edu.get('relevant_coursework', []))}",
@@ -122,14 +330,14 @@ class KnowledgeService:
             })
         
         # Preferences chunk
-        preferences = self.personal_info.get("preferences", {})
+        preferences = personal_info.get("preferences", {})
         chunks.append({
             "content": f"Job Preferences: Salary range {preferences.get('salary_range', 'Not specified')}, job types {', '.join(preferences.get('job_types', []))}, company size preference {', '.join(preferences.get('company_size', []))}, work environment {preferences.get('work_environment', 'Not specified')}, career goals {preferences.get('career_goals', 'Not specified')}",
             "metadata": {"type": "preferences", "section": "job_preferences"}
         })
         
         # Availability chunk
-        availability = self.personal_info.get("availability", {})
+        availability = personal_info.get("availability", {})
         chunks.append({
             "content": f"Availability: Notice period {availability.get('notice_period', 'Not specified')}, start date {availability.get('start_date', 'Not specified')}, interview availability {availability.get('interview_availability', 'Not specified')}, timezone {availability.get('timezone', 'Not specified')}",
             "metadata": {"type": "availability", "section": "timing"}
@@ -137,17 +345,36 @@ class KnowledgeService:
         
         return chunks
     
-    def search_knowledge(self, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
-        """Search the knowledge base for relevant information."""
+    def search_knowledge(
+        self, 
+        query: str, 
+        n_results: int = 5, 
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Search the knowledge base, optionally filtering on chunk metadata."""
         try:
-            if not self.chroma_client:
+            if not self.collection:
                 return []
             
-            collection = self.chroma_client.get_collection("personal_knowledge")
-            results = collection.query(
-                query_texts=[query],
-                n_results=n_results
+            # Repeated queries are served from the LRU until the index changes
+            cache_key = (
+                self.snapshot.version,
+                " ".join(query.lower().split()),
+                n_results,
+                tuple(sorted((where or {}).items()))
             )
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+            
+            query_args = {"query_texts": [query], "n_results": n_results}
+            if where:
+                query_args["where"] = where if len(where) == 1 else {
+                    "$and": [{field: value} for field, value in where.items()]
+                }
+            
+            with STAGE_SECONDS.time("knowledge_search"):
+                results = self.collection.query(**query_args)
             
             # Format results
             formatted_results = []
@@ -158,11 +385,16 @@ class KnowledgeService:
                     "distance": results['distances'][0][i]
                 })
             
-            return formatted_results
+            self.search_cache.put(cache_key, formatted_results)
+            return list(formatted_results)
         except Exception as e:
             logger.error(f"Error searching knowledge base: {e}")
             return []
     
+    def get_snapshot(self) -> KnowledgeSnapshot:
+        """Current knowledge snapshot; hold on to it for a consistent view within a request."""
+        return self.snapshot
+    
     def get_personal_info(self) -> Dict[str, Any]:
         """Get personal information."""
         return self.personal_info
@@ -171,29 +403,24 @@ class KnowledgeService:
         """Get conversation examples."""
         return self.conversation_examples
     
+    def match_faq(self, message: str, snapshot: Optional[KnowledgeSnapshot] = None) -> Optional[Dict[str, Any]]:
+        """Curated answer for a canonical recruiter question, if the message clearly matches one."""
+        if not self.settings.faq_fast_path_enabled:
+            return None
+        return (snapshot or self.snapshot).faq_index.match(message)
+    
     def start_conversation(self) -> str:
-        """Start a new conversation and return conversation ID."""
-        conversation_id = str(uuid.uuid4())
-        self.conversations[conversation_id] = {
-            "messages": [],
-            "created_at": datetime.now(),
-            "last_updated": datetime.now()
-        }
-        return conversation_id
-    
-    def add_message(self, conversation_id: str, message: ConversationMessage):
-        """Add a message to a conversation."""
-        if conversation_id in self.conversations:
-            self.conversations[conversation_id]["messages"].append(message)
-            self.conversations[conversation_id]["last_updated"] = datetime.now()
+        """Start a new conversation owned by this persona and return conversation ID."""
+        return self.conversation_store.create(self.persona_id)
+    
+    def add_message(self, conversation_id: str, message: ConversationMessage) -> int:
+        """Add a message to a conversation and return its message count."""
+        return self.conversation_store.append(conversation_id, message)
     
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get conversation by ID."""
-        return self.conversations.get(conversation_id)
-    
-    def get_conversation_messages(self, conversation_id: str) -> List[ConversationMessage]:
-        """Get messages from a conversation."""
-        conversation = self.get_conversation(conversation_id)
-        if conversation:
-            return conversation["messages"]
-        return []
+        return self.conversation_store.get(conversation_id)
+    
+    def get_conversation_messages(self, conversation_id: str, limit: Optional[int] = None) -> List[ConversationMessage]:
+        """Get messages from a conversation, optionally only the most recent `limit`."""
+        return self.conversation_store.get_messages(conversation_id, limit)
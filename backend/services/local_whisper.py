@@ -0,0 +1,63 @@
+"""
+Offline Whisper transcription in a pool of worker processes.
+"""
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from loguru import logger
+
+
+# Per-process model, loaded once by the pool initializer
+_model = None
+
+
+def _load_model(model_name: str):
+    global _model
+    import whisper
+    _model = whisper.load_model(model_name, device="cpu")
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _transcribe(audio_data: bytes, suffix: str, language: str) -> str:
+    # whisper decodes through ffmpeg, which needs a file path
+    with tempfile.NamedTemporaryFile(suffix=suffix) as audio_file:
+        audio_file.write(audio_data)
+        audio_file.flush()
+        result = _model.transcribe(audio_file.name, language=language, fp16=False)
+    return result["text"].strip()
+
+
+class LocalWhisperEngine:
+    """CPU-only Whisper running in a ProcessPoolExecutor so the event loop never blocks."""
+    
+    def __init__(self, model_name: str = "base", workers: Optional[int] = None):
+        self.model_name = model_name
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_load_model,
+            initargs=(model_name,)
+        )
+    
+    def warm_up(self):
+        """Start every worker now so models are loaded before the first request."""
+        for _ in range(self.workers):
+            self._executor.submit(_ping)
+        logger.info(f"Loading local Whisper '{self.model_name}' in {self.workers} worker processes")
+    
+    async def transcribe(self, audio_data: bytes, filename: str = "audio.wav", language: str = "en") -> str:
+        """Transcribe audio bytes in a worker process."""
+        suffix = os.path.splitext(filename)[1] or ".wav"
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _transcribe, audio_data, suffix, language)
+    
+    def shutdown(self):
+        """Stop the worker processes without waiting for queued work."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,130 @@
+"""
+Lightweight in-process metrics with Prometheus text exposition.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_registry: List["_Metric"] = []
+
+
+def _format_labels(label_name: str, label_value: str, extra: str = "") -> str:
+    labels = f'{label_name}="{label_value}"' if label_name else ""
+    if extra:
+        labels = f"{labels},{extra}" if labels else extra
+    return f"{{{labels}}}" if labels else ""
+
+
+class _Metric:
+    kind = ""
+    
+    def __init__(self, name: str, description: str, label: str = ""):
+        self.name = name
+        self.description = description
+        self.label = label
+        self._lock = threading.Lock()
+        _registry.append(self)
+    
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonic counter with one optional label."""
+    kind = "counter"
+    
+    def __init__(self, name: str, description: str, label: str = ""):
+        super().__init__(name, description, label)
+        self._values: Dict[str, float] = {}
+    
+    def inc(self, label_value: str = "", amount: float = 1.0):
+        with self._lock:
+            self._values[label_value] = self._values.get(label_value, 0.0) + amount
+    
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = list(self._values.items())
+        for label_value, value in values:
+            lines.append(f"{self.name}{_format_labels(self.label, label_value)} {value}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram with one optional label."""
+    kind = "histogram"
+    
+    def __init__(self, name: str, description: str, label: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, description, label)
+        self.buckets = buckets
+        self._series: Dict[str, List[float]] = {}  # bucket counts..., +Inf count, sum
+    
+    def observe(self, value: float, label_value: str = ""):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+    
+    @contextmanager
+    def time(self, label_value: str = ""):
+        """Observe the wall-clock duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, label_value)
+    
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            series_items = [(label_value, list(series)) for label_value, series in self._series.items()]
+        for label_value, series in series_items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label, label_value, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label, label_value)} {series[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.label, label_value)} {cumulative}")
+        return lines
+
+
+def render_metrics() -> str:
+    """All registered metrics in Prometheus text format."""
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+STAGE_SECONDS = Histogram(
+    "ai_persona_stage_seconds",
+    "Latency of individual request stages in seconds.",
+    label="stage"
+)
+
+REQUEST_SECONDS = Histogram(
+    "ai_persona_request_seconds",
+    "Total HTTP request latency in seconds.",
+    label="route"
+)
+
+MOCK_FALLBACKS = Counter(
+    "ai_persona_mock_fallbacks_total",
+    "Responses served by the mock generator after an OpenAI failure.",
+    label="operation"
+)
+
+TTS_FAILURES = Counter(
+    "ai_persona_tts_failures_total",
+    "Sentences whose speech synthesis failed and were left out of the audio.",
+    label="operation"
+)
@@ -1,12 +1,45 @@
 """
 OpenAI service for handling AI interactions.
 """
+import asyncio
+import io
 import json
+import time
+from pathlib import Path
+import httpx
 import openai
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, BinaryIO, List, Dict, Any, Optional, Tuple, Union
 from loguru import logger
 from config import get_settings
 from models import ConversationMessage, MessageRole
+from services.audio_cache import AudioCache, audio_cache_key
+from services.audio_segments import read_recording, split_recording
+from services.embedding_cache import EmbeddingCache
+from services.history import HistorySummarizer, select_history
+from services.local_whisper import LocalWhisperEngine
+from services.lru_cache import LRUCache
+from services.metrics import MOCK_FALLBACKS, STAGE_SECONDS, TTS_FAILURES
+from services.prompt_cache import SystemPromptCache
+from services.semantic_cache import SemanticCache
+from services.singleflight import SingleFlight, request_key
+from services.speech import SentenceBuffer, split_sentences
+from services.tokens import count_message_tokens, count_tokens
+
+
+PERSONA_INSTRUCTIONS = """INSTRUCTIONS:
+1. Always respond as if you ARE the candidate, not as an AI representing them
+2. Be professional, friendly, and enthusiastic about opportunities
+3. Keep responses concise but comprehensive (2-3 sentences typically)
+4. Always mention work authorization status when relevant
+5. Be specific about skills and experience when asked
+6. Show genuine interest in the role and company
+7. Ask thoughtful questions about the role and company
+8. Never mention that you are an AI or bot
+9. If you don't know something specific, say you'd be happy to discuss it further
+10. Always maintain a positive, professional tone
+
+Remember: You are representing a real person in job interviews. Be authentic, professional, and helpful.
+"""
 
 
 class OpenAIService:
@@ -14,49 +47,352 @@ class OpenAIService:
     
     def __init__(self):
         self.settings = get_settings()
-        self.client = openai.OpenAI(api_key=self.settings.openai_api_key)
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.settings.openai_max_connections,
+                max_keepalive_connections=self.settings.openai_max_keepalive_connections
+            ),
+            timeout=self.settings.openai_timeout
+        )
+        self.client = openai.AsyncOpenAI(
+            api_key=self.settings.openai_api_key,
+            base_url=self.settings.openai_base_url,
+            http_client=self.http_client,
+            max_retries=self.settings.openai_max_retries
+        )
         self.model = self.settings.openai_model
         self.embedding_model = self.settings.openai_embedding_model
+        self.embedding_cache = EmbeddingCache(
+            self.settings.embedding_cache_dir, self.embedding_model, self.settings.embedding_cache_max_entries
+        )
+        self.completion_params = {
+            "max_tokens": 500,
+            "temperature": 0.7,
+            "presence_penalty": 0.1,
+            "frequency_penalty": 0.1
+        }
+        self.single_flight = SingleFlight()
+        # One compiled prompt and one semantic cache per active persona snapshot
+        self.prompt_cache = SystemPromptCache(self._build_system_prompt, self.settings.persona_cache_size)
+        self.core_prompt_cache = SystemPromptCache(self._build_core_prompt, self.settings.persona_cache_size)
+        self.semantic_caches = LRUCache(
+            self.settings.persona_cache_size
+        ) if self.settings.semantic_cache_enabled else None
+        self.audio_cache = AudioCache(
+            self.settings.tts_cache_dir, self.settings.tts_cache_max_mb * 1024 * 1024
+        )
+        self.local_whisper = LocalWhisperEngine(
+            self.settings.local_whisper_model, self.settings.local_whisper_workers
+        ) if self.settings.stt_engine in ("local", "auto") else None
+        self.summarizer = HistorySummarizer(
+            self._summarize_history
+        ) if self.settings.history_summary_enabled else None
         
     async def generate_response(
         self, 
         messages: List[ConversationMessage], 
         personal_info: Dict[str, Any],
-        conversation_examples: Dict[str, Any]
+        conversation_examples: Dict[str, Any],
+        context: Optional[List[Dict[str, Any]]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        conversation_id: Optional[str] = None
     ) -> str:
-        """Generate AI response based on conversation history and personal info."""
+        """Generate AI response based on conversation history and personal info.
+        
+        When `context` (retrieved knowledge chunks) is given, a compact prompt is
+        sent instead of the full profile. Prompt statistics are written to
+        `metadata` if provided.
+        """
         try:
-            # Build system prompt with personal information
-            system_prompt = self._build_system_prompt(personal_info, conversation_examples)
+            # Serve near-duplicate questions from the semantic cache
+            cached, question = await self._lookup_cached_answer(
+                messages, personal_info, conversation_examples, metadata
+            )
+            if cached is not None:
+                return cached
             
-            # Convert messages to OpenAI format
-            openai_messages = [
-                {"role": "system", "content": system_prompt}
-            ]
+            openai_messages = self._build_messages(
+                messages, personal_info, conversation_examples, context, metadata, conversation_id
+            )
             
-            for message in messages[-10:]:  # Keep last 10 messages for context
-                openai_messages.append({
-                    "role": message.role.value,
-                    "content": message.content
-                })
+            # Generate response, sharing the upstream call with identical in-flight requests
+            with STAGE_SECONDS.time("openai_chat"):
+                response = await self.single_flight.do(
+                    request_key("chat", {
+                        "model": self.model,
+                        "messages": self._normalize_for_coalescing(openai_messages),
+                        **self.completion_params
+                    }),
+                    lambda: self.client.chat.completions.create(
+                        model=self.model,
+                        messages=openai_messages,
+                        **self.completion_params
+                    )
+                )
             
-            # Generate response
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=openai_messages,
-                max_tokens=500,
-                temperature=0.7,
-                presence_penalty=0.1,
-                frequency_penalty=0.1
-            )
+            if metadata is not None and response.usage:
+                metadata["prompt_tokens"] = response.usage.prompt_tokens
             
-            return response.choices[0].message.content.strip()
+            answer = response.choices[0].message.content.strip()
+            self._remember_answer(question, answer)
+            return answer
             
         except Exception as e:
             logger.error(f"Error generating OpenAI response: {e}")
             # Mock response for testing when API quota is exceeded
+            MOCK_FALLBACKS.inc("chat")
             return self._generate_mock_response(messages, personal_info)
     
+    async def stream_response(
+        self, 
+        messages: List[ConversationMessage], 
+        personal_info: Dict[str, Any],
+        conversation_examples: Dict[str, Any],
+        context: Optional[List[Dict[str, Any]]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        conversation_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream the AI response token by token as it is generated."""
+        emitted = False
+        parts = []
+        try:
+            cached, question = await self._lookup_cached_answer(
+                messages, personal_info, conversation_examples, metadata
+            )
+            if cached is not None:
+                yield cached
+                return
+            
+            openai_messages = self._build_messages(
+                messages, personal_info, conversation_examples, context, metadata, conversation_id
+            )
+            
+            started = time.perf_counter()
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=openai_messages,
+                stream=True,
+                **self.completion_params
+            )
+            
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if not emitted:
+                        STAGE_SECONDS.observe(time.perf_counter() - started, "openai_first_token")
+                    emitted = True
+                    parts.append(delta)
+                    yield delta
+            
+            STAGE_SECONDS.observe(time.perf_counter() - started, "openai_chat_stream")
+            
+            self._remember_answer(question, "".join(parts).strip())
+            
+        except Exception as e:
+            logger.error(f"Error streaming OpenAI response: {e}")
+            # Only fall back if nothing reached the client yet
+            if not emitted:
+                MOCK_FALLBACKS.inc("stream")
+                yield self._generate_mock_response(messages, personal_info)
+    
+    async def _lookup_cached_answer(
+        self, 
+        messages: List[ConversationMessage], 
+        personal_info: Dict[str, Any],
+        conversation_examples: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Return (cached answer or None, (question embedding, snapshot version) for later storage).
+        
+        Only opening questions are cached: with earlier turns the answer depends
+        on the conversation (follow-ups, the recruiter's company), not just the
+        question text.
+        """
+        if self.semantic_caches is None or len(messages) != 1 or messages[-1].role != MessageRole.USER:
+            return None, None
+        
+        embedding = await self.generate_embeddings(messages[-1].content.strip().lower())
+        if not embedding:
+            return None, None
+        
+        # Keyed to the persona snapshot so profile edits invalidate cached answers
+        version = self.prompt_cache.get_version(personal_info, conversation_examples)
+        hit = self._semantic_cache_for(version).lookup(embedding, version)
+        if hit is None:
+            return None, (embedding, version)
+        
+        answer, similarity = hit
+        if metadata is not None:
+            metadata["cache"] = "semantic"
+            metadata["cache_similarity"] = round(similarity, 4)
+        return answer, None
+    
+    def _remember_answer(self, question: Optional[Tuple[List[float], str]], answer: str):
+        """Store a freshly generated answer in the semantic cache."""
+        if self.semantic_caches is not None and question and answer:
+            embedding, version = question
+            self._semantic_cache_for(version).store(embedding, answer, version)
+    
+    def _semantic_cache_for(self, version: str) -> SemanticCache:
+        """Semantic cache for one persona snapshot, created on first use."""
+        cache = self.semantic_caches.get(version)
+        if cache is None:
+            cache = SemanticCache(
+                capacity=self.settings.semantic_cache_capacity,
+                threshold=self.settings.semantic_cache_threshold
+            )
+            self.semantic_caches.put(version, cache)
+        return cache
+    
+    def semantic_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Counters summed over the live per-snapshot semantic caches."""
+        if self.semantic_caches is None:
+            return None
+        caches = [cache.stats() for cache in self.semantic_caches.values()]
+        hits = sum(stats["hits"] for stats in caches)
+        misses = sum(stats["misses"] for stats in caches)
+        return {
+            "snapshots": len(caches),
+            "size": sum(stats["size"] for stats in caches),
+            "threshold": self.settings.semantic_cache_threshold,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "evictions": sum(stats["evictions"] for stats in caches)
+        }
+    
+    @staticmethod
+    def _normalize_for_coalescing(openai_messages: List[Dict[str, str]]) -> List[Tuple[str, str]]:
+        """Collapse whitespace and back-to-back duplicate messages (double submits)."""
+        normalized = []
+        for message in openai_messages:
+            entry = (message["role"], " ".join(message["content"].split()))
+            if not normalized or normalized[-1] != entry:
+                normalized.append(entry)
+        return normalized
+    
+    def _build_messages(
+        self, 
+        messages: List[ConversationMessage], 
+        personal_info: Dict[str, Any],
+        conversation_examples: Dict[str, Any],
+        context: Optional[List[Dict[str, Any]]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        conversation_id: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """Convert conversation history to OpenAI chat format."""
+        started = time.perf_counter()
+        if context is None:
+            # Reuse the compiled system prompt for this knowledge snapshot
+            system_message = self.prompt_cache.get_message(personal_info, conversation_examples)
+        else:
+            system_message = self._build_rag_message(personal_info, conversation_examples, context)
+        
+        openai_messages = [system_message]
+        
+        # Keep as much recent history as fits the token budget
+        window, older = select_history(messages, self.settings.history_token_budget)
+        if self.summarizer is not None and conversation_id:
+            summary = self.summarizer.get(conversation_id)
+            if summary and older:
+                openai_messages.append({
+                    "role": "system",
+                    "content": f"Summary of the earlier conversation: {summary}"
+                })
+            self.summarizer.schedule(conversation_id, older)
+        
+        for message in window:
+            openai_messages.append({
+                "role": message.role.value,
+                "content": message.content
+            })
+        
+        if metadata is not None:
+            metadata["prompt_mode"] = "full" if context is None else "rag"
+            metadata["prompt_tokens"] = count_message_tokens(openai_messages)
+            metadata["history_messages"] = len(window)
+        
+        STAGE_SECONDS.observe(time.perf_counter() - started, "prompt_build")
+        return openai_messages
+    
+    async def _summarize_history(
+        self, 
+        previous_summary: Optional[str], 
+        new_messages: List[ConversationMessage]
+    ) -> str:
+        """Fold older turns into a compact running summary."""
+        transcript = "\n".join(
+            f"{message.role.value}: {message.content}" for message in new_messages
+        )
+        if previous_summary:
+            transcript = f"Existing summary: {previous_summary}\n\nNew turns:\n{transcript}"
+        
+        response = await self.client.chat.completions.create(
+            model=self.settings.history_summary_model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Summarize this recruiter conversation in a few sentences. "
+                               "Keep the company, role, and any facts or commitments discussed."
+                },
+                {"role": "user", "content": transcript}
+            ],
+            max_tokens=self.settings.history_summary_max_tokens,
+            temperature=0.2
+        )
+        return response.choices[0].message.content.strip()
+    
+    def _build_rag_message(
+        self, 
+        personal_info: Dict[str, Any], 
+        conversation_examples: Dict[str, Any],
+        context: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Compact core identity plus the retrieved chunks that fit the token budget."""
+        core_prompt = self.core_prompt_cache.get_message(personal_info, conversation_examples)["content"]
+        
+        budget = self.settings.rag_token_budget
+        background = []
+        for chunk in context:
+            tokens = count_tokens(chunk["content"])
+            if tokens > budget:
+                break
+            background.append(f"- {chunk['content']}")
+            budget -= tokens
+        
+        if not background:
+            return {"role": "system", "content": core_prompt}
+        
+        return {
+            "role": "system",
+            "content": core_prompt + "\nRELEVANT BACKGROUND:\n" + "\n".join(background) + "\n"
+        }
+    
+    def _build_core_prompt(
+        self, 
+        personal_info: Dict[str, Any], 
+        conversation_examples: Dict[str, Any]
+    ) -> str:
+        """Build the compact identity prompt used with retrieved context."""
+        personal_details = personal_info.get("personal_details", {})
+        work_auth = personal_info.get("work_authorization", {})
+        prof_summary = personal_info.get("professional_summary", {})
+        personality = conversation_examples.get("personality_traits", {})
+        
+        return f"""
+You are {personal_details.get('name', 'the candidate')}, a {prof_summary.get('title', 'professional')} with {prof_summary.get('years_experience', 'several')} years of experience, talking with a recruiter.
+
+CORE FACTS:
+- Location: {personal_details.get('location', 'Not specified')}
+- Work Authorization: {work_auth.get('status', 'Not specified')}
+- Visa Sponsorship Required: {work_auth.get('sponsorship_required', 'Not specified')}
+
+STYLE: {personality.get('communication_style', 'Professional and friendly')}; {personality.get('tone', 'Confident but humble')}; {personality.get('response_length', 'Concise but comprehensive')}
+
+{PERSONA_INSTRUCTIONS}"""
+    
     def _build_system_prompt(
         self, 
         personal_info: Dict[str, Any], 
@@ -133,20 +469,7 @@ PERSONALITY & COMMUNICATION STYLE:
 - Tone: {personality.get('tone', 'Confident but humble')}
 - Response Length: {personality.get('response_length', 'Concise but comprehensive')}
 
-INSTRUCTIONS:
-1. Always respond as if you ARE the candidate, not as an AI representing them
-2. Be professional, friendly, and enthusiastic about opportunities
-3. Keep responses concise but comprehensive (2-3 sentences typically)
-4. Always mention work authorization status when relevant
-5. Be specific about skills and experience when asked
-6. Show genuine interest in the role and company
-7. Ask thoughtful questions about the role and company
-8. Never mention that you are an AI or bot
-9. If you don't know something specific, say you'd be happy to discuss it further
-10. Always maintain a positive, professional tone
-
-Remember: You are representing a real person in job interviews. Be authentic, professional, and helpful.
-"""
+{PERSONA_INSTRUCTIONS}"""
         
         return system_prompt
     
@@ -184,40 +507,209 @@ Remember: You are representing a real person in job interviews. Be authentic, pr
             return f"Thanks for your question! I'm {personal_details.get('name', 'Abhinav')}, an experienced {prof_summary.get('title', 'AI/ML Engineer')} with a strong background in {', '.join(prof_summary.get('key_skills', ['Python', 'Machine Learning'])[:3])}. I'd be happy to discuss how my skills and experience can contribute to your team. What specific aspects would you like to know more about?"
     
     async def generate_embeddings(self, text: str) -> List[float]:
-        """Generate embeddings for text using OpenAI."""
+        """Generate embeddings for text using OpenAI.
+        
+        Used for one-off recruiter questions, so it bypasses the disk cache.
+        """
         try:
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=text
+            response = await self.single_flight.do(
+                request_key("embedding", {"model": self.embedding_model, "input": text}),
+                lambda: self.client.embeddings.create(
+                    model=self.embedding_model,
+                    input=text
+                )
             )
             return response.data[0].embedding
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
             return []
     
+    async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts, in input order.
+        
+        Cached vectors are served from disk; the remaining unique texts are sent
+        in `embedding_batch_size` chunks, up to `embedding_max_parallel` at once,
+        and cached. Meant for corpus text; one-off queries should use
+        `generate_embeddings`. Raises if any request fails.
+        """
+        cached = self.embedding_cache.get_many(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+        fresh: Dict[str, List[float]] = {}
+        if missing:
+            size = self.settings.embedding_batch_size
+            semaphore = asyncio.Semaphore(self.settings.embedding_max_parallel)
+            
+            async def embed(batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    response = await self.single_flight.do(
+                        request_key("embedding", {"model": self.embedding_model, "input": batch}),
+                        lambda: self.client.embeddings.create(
+                            model=self.embedding_model,
+                            input=batch
+                        )
+                    )
+                return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+            
+            batches = [missing[i:i + size] for i in range(0, len(missing), size)]
+            for batch, vectors in zip(batches, await asyncio.gather(*(embed(batch) for batch in batches))):
+                await asyncio.to_thread(self.embedding_cache.put_many, batch, vectors)
+                fresh.update(zip(batch, vectors))
+        return [vector.tolist() if vector is not None else fresh[text] for text, vector in zip(texts, cached)]
+    
+    def audio_key(self, text: str) -> str:
+        """Cache key for synthesizing `text` with the configured voice."""
+        return audio_cache_key(
+            text, self.settings.tts_model, self.settings.voice_model, self.settings.voice_speed
+        )
+    
     async def text_to_speech(self, text: str) -> bytes:
-        """Convert text to speech using OpenAI TTS."""
+        """Convert text to speech using OpenAI TTS, reusing previously synthesized audio."""
+        key = self.audio_key(text)
+        return await self.single_flight.do(f"tts:{key}", lambda: self._synthesize(text, key))
+    
+    async def _synthesize(self, text: str, key: str) -> bytes:
+        """Serve audio from the cache, synthesizing and caching it on a miss."""
+        cached = await asyncio.to_thread(self.audio_cache.get, key)
+        if cached:
+            return cached
+        
         try:
-            response = self.client.audio.speech.create(
-                model="tts-1",
-                voice=self.settings.voice_model,
-                input=text,
-                speed=self.settings.voice_speed
-            )
-            return response.content
+            # Only the API call is timed; cache hits would skew the distribution
+            with STAGE_SECONDS.time("tts"):
+                response = await self.client.audio.speech.create(
+                    model=self.settings.tts_model,
+                    voice=self.settings.voice_model,
+                    input=text,
+                    speed=self.settings.voice_speed
+                )
+            audio_data = response.content
         except Exception as e:
             logger.error(f"Error generating speech: {e}")
             return b""
+        
+        try:
+            await asyncio.to_thread(self.audio_cache.put, key, audio_data)
+        except Exception as e:
+            logger.error(f"Error caching speech: {e}")
+        return audio_data
+    
+    async def stream_speech(self, text: str) -> AsyncIterator[bytes]:
+        """Synthesize sentence segments concurrently and yield their audio in order."""
+        segments = split_sentences(text)
+        semaphore = asyncio.Semaphore(self.settings.tts_max_parallel)
+        
+        async def synthesize(segment: str) -> bytes:
+            async with semaphore:
+                return await self.text_to_speech(segment)
+        
+        tasks = [asyncio.create_task(synthesize(segment)) for segment in segments]
+        try:
+            for index, task in enumerate(tasks):
+                audio_data = await task
+                if audio_data:
+                    yield audio_data
+                else:
+                    TTS_FAILURES.inc("stream_speech")
+                    logger.warning(f"Skipping sentence {index + 1}/{len(tasks)} with no synthesized audio")
+        finally:
+            # Stop pending synthesis if the client went away
+            for task in tasks:
+                task.cancel()
+    
+    async def stream_voice(self, tokens: AsyncIterator[str]) -> AsyncIterator[Tuple[str, Any]]:
+        """Overlap text generation with speech synthesis.
+        
+        Yields ("token", text) as tokens arrive and ("audio", {index, text, audio})
+        for each sentence, in order, as soon as its synthesis finishes. TTS for a
+        sentence starts while the model is still generating the next ones.
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        segments: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.settings.tts_max_parallel)
+        tts_tasks = []
+        
+        async def synthesize(sentence: str) -> bytes:
+            async with semaphore:
+                return await self.text_to_speech(sentence)
+        
+        def start_segment(sentence: str):
+            task = asyncio.create_task(synthesize(sentence))
+            tts_tasks.append(task)
+            segments.put_nowait((sentence, task))
+        
+        async def generate():
+            buffer = SentenceBuffer()
+            try:
+                async for token in tokens:
+                    events.put_nowait(("token", token))
+                    for sentence in buffer.feed(token):
+                        start_segment(sentence)
+                tail = buffer.flush()
+                if tail:
+                    start_segment(tail)
+            finally:
+                segments.put_nowait(None)
+        
+        async def emit_audio():
+            index = 0
+            while True:
+                segment = await segments.get()
+                if segment is None:
+                    break
+                sentence, task = segment
+                audio_data = await task
+                if audio_data:
+                    events.put_nowait(("audio", {"index": index, "text": sentence, "audio": audio_data}))
+                    index += 1
+                else:
+                    TTS_FAILURES.inc("stream_voice")
+                    logger.warning(f"Skipping sentence with no synthesized audio: {sentence[:60]!r}")
+            events.put_nowait(None)
+        
+        workers = [asyncio.create_task(generate()), asyncio.create_task(emit_audio())]
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+        finally:
+            for task in workers + tts_tasks:
+                task.cancel()
+    
+    async def speech_to_text(self, audio_data: bytes, filename: str = "audio.wav") -> str:
+        """Convert speech to text with the configured engine (STT_ENGINE)."""
+        with STAGE_SECONDS.time("stt"):
+            return await self._speech_to_text(audio_data, filename)
     
-    async def speech_to_text(self, audio_data: bytes) -> str:
-        """Convert speech to text using OpenAI Whisper."""
+    async def _speech_to_text(self, audio_data: bytes, filename: str) -> str:
+        """Dispatch to the configured transcription engine."""
+        engine = self.settings.stt_engine
+        if engine == "local":
+            return await self._local_speech_to_text(audio_data, filename)
+        
+        text = await self._api_speech_to_text(audio_data, filename)
+        if not text and engine == "auto":
+            # Hosted API unavailable or throttled: fall back to the local model
+            return await self._local_speech_to_text(audio_data, filename)
+        return text
+    
+    async def _local_speech_to_text(self, audio_data: bytes, filename: str) -> str:
+        """Transcribe with the local Whisper worker pool."""
+        try:
+            return await self.local_whisper.transcribe(audio_data, filename)
+        except Exception as e:
+            logger.error(f"Error transcribing speech locally: {e}")
+            return ""
+    
+    async def _api_speech_to_text(self, audio_data: bytes, filename: str) -> str:
+        """Transcribe with the hosted OpenAI Whisper API."""
         try:
             # Create a temporary file-like object
-            import io
             audio_file = io.BytesIO(audio_data)
-            audio_file.name = "audio.wav"
+            audio_file.name = filename
             
-            response = self.client.audio.transcriptions.create(
+            response = await self.client.audio.transcriptions.create(
                 model="whisper-1",
                 file=audio_file,
                 language="en"
@@ -226,3 +718,45 @@ Remember: You are representing a real person in job interviews. Be authentic, pr
         except Exception as e:
             logger.error(f"Error transcribing speech: {e}")
             return ""
+    
+    async def transcribe_file(self, source: Union[str, BinaryIO], filename: Optional[str] = None) -> str:
+        """Transcribe a recording given as a path or an open binary file.
+        
+        Long recordings are split on silence and the segments transcribed
+        concurrently, then stitched back together in order. `filename` names an
+        open file's format; it defaults to the path's own name.
+        """
+        filename = filename or (Path(source).name if isinstance(source, str) else "audio.wav")
+        try:
+            recording = await asyncio.to_thread(
+                split_recording,
+                source,
+                target_ms=self.settings.stt_segment_seconds * 1000,
+                min_silence_ms=self.settings.stt_min_silence_ms,
+                format=Path(filename).suffix.lstrip(".").lower() or None
+            )
+        except Exception as e:
+            logger.warning(f"Could not segment audio, transcribing in one piece: {e}")
+            recording = None
+        
+        if recording is None:
+            audio_data = await asyncio.to_thread(read_recording, source)
+            return await self.speech_to_text(audio_data, filename=filename)
+        
+        semaphore = asyncio.Semaphore(self.settings.stt_max_parallel)
+        
+        async def transcribe(index: int) -> str:
+            async with semaphore:
+                # Encode only while this segment is in flight, so at most
+                # `stt_max_parallel` WAV buffers exist at once
+                segment = await asyncio.to_thread(recording.export, index)
+                return await self.speech_to_text(segment, filename=f"segment_{index}.wav")
+        
+        texts = await asyncio.gather(*(transcribe(index) for index in range(len(recording))))
+        return " ".join(text.strip() for text in texts if text.strip())
+
+    async def close(self):
+        """Close the shared HTTP connection pool and any worker processes."""
+        if self.local_whisper is not None:
+            self.local_whisper.shutdown()
+        await self.client.close()
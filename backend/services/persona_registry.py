@@ -0,0 +1,113 @@
+"""
+Registry of persona knowledge services, loaded on demand and LRU-evicted.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from config import get_settings
+from services.knowledge_service import (
+    PERSONA_ID_PATTERN,
+    KnowledgeResources,
+    KnowledgeService,
+    persona_paths
+)
+
+
+class UnknownPersonaError(KeyError):
+    """No profile data exists for the requested persona ID."""
+
+
+class PersonaRegistry:
+    """Persona ID -> KnowledgeService, built on first request.
+    
+    At most `capacity` personas are resident; each holds its own snapshot, FAQ
+    index, search cache and vector index handle. The conversation store, Chroma
+    client and embedding model are shared through KnowledgeResources, so memory
+    grows with the active personas only. An evicted persona is simply rebuilt
+    on its next request, which is cheap because its index is already persisted.
+    """
+    
+    def __init__(self, capacity: Optional[int] = None):
+        self.settings = get_settings()
+        self.capacity = capacity or self.settings.persona_cache_size
+        self.resources = KnowledgeResources(self.settings)
+        self._lock = threading.Lock()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._personas: "OrderedDict[str, KnowledgeService]" = OrderedDict()
+        self.loads = 0
+        self.evictions = 0
+    
+    @property
+    def conversation_store(self):
+        return self.resources.conversation_store
+    
+    def exists(self, persona_id: str) -> bool:
+        """Whether profile data exists for `persona_id`."""
+        if persona_id == self.settings.default_persona:
+            return True
+        return bool(PERSONA_ID_PATTERN.match(persona_id)) and os.path.isfile(
+            persona_paths(self.settings, persona_id)[0]
+        )
+    
+    def peek(self, persona_id: Optional[str] = None) -> Optional[KnowledgeService]:
+        """The persona's service if it is already loaded, without loading it."""
+        persona_id = persona_id or self.settings.default_persona
+        with self._lock:
+            service = self._personas.get(persona_id)
+            if service is not None:
+                self._personas.move_to_end(persona_id)
+            return service
+    
+    def get(self, persona_id: Optional[str] = None) -> KnowledgeService:
+        """The persona's service, loading it (and evicting the coldest) if needed."""
+        persona_id = persona_id or self.settings.default_persona
+        service = self.peek(persona_id)
+        if service is not None:
+            return service
+        if not self.exists(persona_id):
+            raise UnknownPersonaError(persona_id)
+        
+        # One loader per persona; other personas keep loading in parallel
+        with self._lock:
+            load_lock = self._loading.setdefault(persona_id, threading.Lock())
+        with load_lock:
+            service = self.peek(persona_id)
+            if service is None:
+                service = KnowledgeService(persona_id, self.resources)
+                with self._lock:
+                    self._personas[persona_id] = service
+                    self._loading.pop(persona_id, None)
+                    self.loads += 1
+                    while len(self._personas) > self.capacity:
+                        evicted, _ = self._personas.popitem(last=False)
+                        self.evictions += 1
+                        logger.info(f"Evicted persona {evicted}")
+        return service
+    
+    def loaded(self) -> List[KnowledgeService]:
+        """Currently resident persona services, least recently used first."""
+        with self._lock:
+            return list(self._personas.values())
+    
+    def list_personas(self) -> List[str]:
+        """Every persona ID with profile data on disk."""
+        personas = [self.settings.default_persona]
+        if os.path.isdir(self.settings.personas_directory):
+            personas.extend(
+                name for name in sorted(os.listdir(self.settings.personas_directory))
+                if name != self.settings.default_persona and self.exists(name)
+            )
+        return personas
+    
+    def stats(self) -> Dict[str, Any]:
+        """Residency and load/eviction counters."""
+        with self._lock:
+            loaded = list(self._personas)
+        return {
+            "loaded": loaded,
+            "capacity": self.capacity,
+            "loads": self.loads,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,96 @@
+"""
+Versioned cache for the compiled system prompt.
+"""
+import hashlib
+import json
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from loguru import logger
+from services.lru_cache import LRUCache
+
+
+def content_hash(*documents: Any) -> str:
+    """Stable hash of one or more JSON-serializable documents."""
+    payload = json.dumps(documents, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SystemPromptCache:
+    """Compile the system prompt once per knowledge snapshot and reuse it.
+    
+    Holds up to `capacity` compiled prompts (one per active persona snapshot),
+    evicting the least recently used.
+    """
+    
+    def __init__(self, builder: Callable[[Dict[str, Any], Dict[str, Any]], str], capacity: int = 1):
+        self._builder = builder
+        self._lock = threading.Lock()
+        # (id(personal_info), id(conversation_examples)) -> (sources, version); the
+        # entry keeps the source objects alive so their ids cannot be reused
+        self._sources = LRUCache(capacity)
+        self._messages = LRUCache(capacity)  # version -> system message
+        self._version: Optional[str] = None
+        self.hits = 0
+        self.rebuilds = 0
+        self.built_at: Optional[datetime] = None
+    
+    def get_message(
+        self, 
+        personal_info: Dict[str, Any], 
+        conversation_examples: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """Return the pre-serialized system message for this snapshot."""
+        return self._lookup(personal_info, conversation_examples)[1]
+    
+    def get_version(self, personal_info: Dict[str, Any], conversation_examples: Dict[str, Any]) -> str:
+        """Content hash of this snapshot, compiling its prompt if needed."""
+        return self._lookup(personal_info, conversation_examples)[0]
+    
+    def _lookup(
+        self, 
+        personal_info: Dict[str, Any], 
+        conversation_examples: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, str]]:
+        key = (id(personal_info), id(conversation_examples))
+        # Fast path: the knowledge service hands out the same objects until reload
+        entry = self._sources.get(key)
+        if entry is not None:
+            message = self._messages.get(entry[1])
+            if message is not None:
+                self.hits += 1
+                self._version = entry[1]
+                return entry[1], message
+        
+        with self._lock:
+            version = content_hash(personal_info, conversation_examples)
+            message = self._messages.get(version)
+            if message is None:
+                message = {
+                    "role": "system",
+                    "content": self._builder(personal_info, conversation_examples)
+                }
+                self._messages.put(version, message)
+                self.rebuilds += 1
+                self.built_at = datetime.now()
+                logger.info(f"Compiled system prompt version {version[:12]}")
+            else:
+                self.hits += 1
+            self._sources.put(key, ((personal_info, conversation_examples), version))
+            self._version = version
+            return version, message
+    
+    @property
+    def version(self) -> Optional[str]:
+        """Content hash of the most recently used snapshot."""
+        return self._version
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring."""
+        return {
+            "version": self._version,
+            "compiled": self._messages.stats()["size"],
+            "hits": self.hits,
+            "rebuilds": self.rebuilds,
+            "built_at": self.built_at.isoformat() if self.built_at else None
+        }
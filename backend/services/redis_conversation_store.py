@@ -0,0 +1,101 @@
+"""
+Redis-backed conversation store shared across workers and replicas.
+"""
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import redis
+from models import ConversationMessage
+from services.conversation_store import ConversationStore
+
+
+class RedisConversationStore(ConversationStore):
+    """Keeps each conversation as a metadata hash plus a list of JSON messages.
+    
+    Expiry is delegated to Redis key TTLs, which are refreshed on every write.
+    Any client exposing the redis-py API (e.g. fakeredis.FakeRedis) can be injected.
+    Calls block on the network, so async callers should run them in a worker thread.
+    """
+    
+    def __init__(self, client: redis.Redis, ttl_seconds: int = 3600, key_prefix: str = "conversation"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.created = 0
+        self.appended = 0
+    
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisConversationStore":
+        """Create a store backed by a pooled client for `url`."""
+        return cls(redis.Redis.from_url(url, decode_responses=True), **kwargs)
+    
+    def _meta_key(self, conversation_id: str) -> str:
+        return f"{self.key_prefix}:{conversation_id}:meta"
+    
+    def _messages_key(self, conversation_id: str) -> str:
+        return f"{self.key_prefix}:{conversation_id}:messages"
+    
+    def create(self, persona_id: Optional[str] = None) -> str:
+        conversation_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+        meta_key = self._meta_key(conversation_id)
+        mapping = {"created_at": now, "last_updated": now}
+        if persona_id:
+            mapping["persona_id"] = persona_id
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hset(meta_key, mapping=mapping)
+        pipe.expire(meta_key, self.ttl_seconds)
+        pipe.execute()
+        self.created += 1
+        return conversation_id
+    
+    def append(self, conversation_id: str, message: ConversationMessage) -> int:
+        meta_key = self._meta_key(conversation_id)
+        if not self.client.exists(meta_key):
+            return 0
+        messages_key = self._messages_key(conversation_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.rpush(messages_key, message.model_dump_json())
+        pipe.hset(meta_key, "last_updated", datetime.now().isoformat())
+        pipe.expire(messages_key, self.ttl_seconds)
+        pipe.expire(meta_key, self.ttl_seconds)
+        length, *_ = pipe.execute()
+        self.appended += 1
+        return length
+    
+    def get(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hgetall(self._meta_key(conversation_id))
+        pipe.lrange(self._messages_key(conversation_id), 0, -1)
+        meta, raw_messages = pipe.execute()
+        if not meta:
+            return None
+        return {
+            "messages": self._decode(raw_messages),
+            "persona_id": meta.get("persona_id"),
+            "created_at": datetime.fromisoformat(meta["created_at"]),
+            "last_updated": datetime.fromisoformat(meta["last_updated"])
+        }
+    
+    def get_persona_id(self, conversation_id: str) -> Optional[str]:
+        return self.client.hget(self._meta_key(conversation_id), "persona_id")
+    
+    def get_messages(self, conversation_id: str, limit: Optional[int] = None) -> List[ConversationMessage]:
+        start = -limit if limit else 0
+        return self._decode(self.client.lrange(self._messages_key(conversation_id), start, -1))
+    
+    def stats(self) -> Dict[str, Any]:
+        # Per-process counters: counting keys would mean a SCAN over the whole keyspace
+        return {
+            "backend": "redis",
+            "created": self.created,
+            "appended": self.appended,
+            "ttl_seconds": self.ttl_seconds
+        }
+    
+    async def close(self):
+        self.client.close()
+    
+    @staticmethod
+    def _decode(raw_messages: List[str]) -> List[ConversationMessage]:
+        return [ConversationMessage.model_validate_json(raw) for raw in raw_messages]
@@ -0,0 +1,103 @@
+"""
+Semantic cache of generated answers keyed by question embeddings.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+
+class SemanticCache:
+    """Bounded LRU cache that matches questions by cosine similarity.
+    
+    Embeddings live in a preallocated float32 matrix so a lookup is a single
+    matrix-vector product. All entries belong to one persona `version`; a
+    lookup or insert under a different version clears the cache.
+    """
+    
+    def __init__(self, capacity: int = 512, threshold: float = 0.95):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.version: Optional[str] = None
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None
+        self._answers: List[Optional[str]] = [None] * capacity
+        self._slots: "OrderedDict[int, None]" = OrderedDict()  # LRU order of occupied slots
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def lookup(self, embedding: List[float], version: str) -> Optional[Tuple[str, float]]:
+        """Return (answer, similarity) for the closest cached question above the threshold."""
+        query = self._normalize(embedding)
+        with self._lock:
+            self._check_version(version)
+            if not self._slots:
+                self.misses += 1
+                return None
+            slots = np.fromiter(self._slots.keys(), dtype=np.intp, count=len(self._slots))
+            scores = self._matrix[slots] @ query
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+            if similarity < self.threshold:
+                self.misses += 1
+                return None
+            slot = int(slots[best])
+            self._slots.move_to_end(slot)
+            self.hits += 1
+            return self._answers[slot], similarity
+    
+    def store(self, embedding: List[float], answer: str, version: str):
+        """Cache `answer` for the question with this embedding."""
+        if self.capacity <= 0:
+            return
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._check_version(version)
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                self._matrix = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+                self._slots.clear()
+            if len(self._slots) < self.capacity:
+                # Slots fill densely from 0 and are only freed all at once
+                slot = len(self._slots)
+            else:
+                slot, _ = self._slots.popitem(last=False)
+                self.evictions += 1
+            self._matrix[slot] = vector
+            self._answers[slot] = answer
+            self._slots[slot] = None
+    
+    def clear(self):
+        """Drop all cached answers."""
+        with self._lock:
+            self._slots.clear()
+            self._answers = [None] * self.capacity
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for threshold tuning."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._slots),
+            "capacity": self.capacity,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+    
+    def _check_version(self, version: str):
+        if version != self.version:
+            if self._slots:
+                self.invalidations += 1
+            self._slots.clear()
+            self._answers = [None] * self.capacity
+            self.version = version
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
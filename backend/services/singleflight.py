@@ -0,0 +1,49 @@
+"""
+Coalescing of identical concurrent upstream requests.
+"""
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+
+def request_key(namespace: str, payload: Any) -> str:
+    """Key for a normalized request payload."""
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return f"{namespace}:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()}"
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one in-flight upstream task.
+    
+    Callers are shielded from each other: cancelling one waiter does not
+    cancel the shared task for the rest.
+    """
+    
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.calls: Dict[str, int] = {}
+        self.coalesced: Dict[str, int] = {}
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn` unless an identical call is already in flight, then share its result."""
+        namespace = key.split(":", 1)[0]
+        self.calls[namespace] = self.calls.get(namespace, 0) + 1
+        
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced[namespace] = self.coalesced.get(namespace, 0) + 1
+        
+        return await asyncio.shield(task)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Per-namespace call and coalescing counters."""
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": dict(self.calls),
+            "coalesced": dict(self.coalesced)
+        }
@@ -0,0 +1,71 @@
+"""
+Helpers for segmenting text into speakable chunks.
+"""
+import re
+from typing import List, Optional
+
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str, min_chars: int = 40, max_chars: int = 400) -> List[str]:
+    """Split text into sentence segments for incremental synthesis.
+    
+    The first sentence is kept on its own so audio can start as early as
+    possible; later short sentences are merged up to `min_chars`, and overly
+    long ones are split on commas/whitespace to stay under `max_chars`.
+    """
+    sentences = [s.strip() for s in _SENTENCE_END_RE.split(text.strip()) if s.strip()]
+    
+    segments: List[str] = []
+    for sentence in sentences:
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(", ", 0, max_chars)
+            if cut <= 0:
+                cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            segments.append(sentence[:cut + 1].strip())
+            sentence = sentence[cut + 1:].strip()
+        if not sentence:
+            continue
+        if len(segments) > 1 and len(segments[-1]) < min_chars:
+            segments[-1] = f"{segments[-1]} {sentence}"
+        else:
+            segments.append(sentence)
+    return segments
+
+
+class SentenceBuffer:
+    """Accumulates streamed text and releases complete sentences.
+    
+    Sentences shorter than `min_chars` are held back and joined with the next
+    one, so a lone "Sure!" does not become its own synthesis request.
+    """
+    
+    def __init__(self, min_chars: int = 20):
+        self.min_chars = min_chars
+        self._buffer = ""
+    
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text; return any sentences it completed."""
+        self._buffer += text
+        sentences = []
+        while True:
+            match = self._find_boundary()
+            if match is None:
+                break
+            sentences.append(self._buffer[:match].strip())
+            self._buffer = self._buffer[match:].lstrip()
+        return sentences
+    
+    def flush(self) -> Optional[str]:
+        """Return whatever text remains once the stream has ended."""
+        remaining, self._buffer = self._buffer.strip(), ""
+        return remaining or None
+    
+    def _find_boundary(self) -> Optional[int]:
+        for match in _SENTENCE_END_RE.finditer(self._buffer):
+            if match.start() >= self.min_chars:
+                return match.start()
+        return None
@@ -0,0 +1,284 @@
+"""
+Durable SQL conversation store with a hot in-memory tier and write-behind batching.
+"""
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from sqlalchemy import (
+    JSON, Column, DateTime, ForeignKey, Integer, MetaData, String, Table, Text,
+    bindparam, create_engine, event, inspect, select, text, update
+)
+from models import ConversationMessage, MessageRole
+from services.conversation_store import ConversationStore, InMemoryConversationStore
+from services.lru_cache import LRUCache
+
+
+metadata = MetaData()
+
+conversations_table = Table(
+    "conversations", metadata,
+    Column("id", String(36), primary_key=True),
+    Column("persona_id", String(64), nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("last_updated", DateTime, nullable=False)
+)
+
+messages_table = Table(
+    "conversation_messages", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("conversation_id", String(36), ForeignKey("conversations.id"), index=True, nullable=False),
+    Column("role", String(16), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("timestamp", DateTime, nullable=False),
+    Column("metadata", JSON, nullable=True)
+)
+
+
+class SQLConversationStore(ConversationStore):
+    """Serves reads from a bounded hot tier and persists writes off the request path.
+    
+    Writes land in memory immediately and are queued; a flusher thread commits
+    the queue in one transaction every `flush_interval_ms` or as soon as
+    `flush_batch_size` rows are pending, whichever comes first.
+    
+    A conversation missing from the hot tier is restored from the database plus
+    the rows still queued in memory; IDs found in neither are remembered for
+    `MISS_TTL_SECONDS` so repeated bogus IDs cost nothing. All methods block on
+    the database, so async callers should run them in a worker thread.
+    """
+    
+    # Short enough that a conversation created by another replica is seen soon after its flush
+    MISS_TTL_SECONDS = 5.0
+    
+    def __init__(
+        self,
+        database_url: str,
+        max_conversations: int = 1000,
+        ttl_seconds: int = 3600,
+        flush_interval_ms: int = 250,
+        flush_batch_size: int = 100
+    ):
+        is_sqlite = database_url.startswith("sqlite")
+        self.engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False} if is_sqlite else {}
+        )
+        if is_sqlite:
+            event.listen(self.engine, "connect", self._configure_sqlite)
+        metadata.create_all(self.engine)
+        self._migrate()
+        
+        self.hot = InMemoryConversationStore(max_conversations, ttl_seconds)
+        self._misses = LRUCache(max_conversations)  # conversation ID -> expiry
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_batch_size = flush_batch_size
+        
+        self._pending_conversations: List[Dict[str, Any]] = []
+        self._pending_messages: List[Dict[str, Any]] = []
+        self._pending_touches: Dict[str, datetime] = {}
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self.flushes = 0
+        self.rows_written = 0
+        self._flusher = threading.Thread(target=self._flush_loop, name="conversation-flusher", daemon=True)
+        self._flusher.start()
+    
+    @staticmethod
+    def _configure_sqlite(dbapi_connection, connection_record):
+        """WAL + NORMAL sync: batched commits without an fsync per transaction."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+    
+    def _migrate(self):
+        """Add columns introduced after the table was first created."""
+        columns = {column["name"] for column in inspect(self.engine).get_columns("conversations")}
+        if "persona_id" not in columns:
+            with self.engine.begin() as conn:
+                conn.execute(text("ALTER TABLE conversations ADD COLUMN persona_id VARCHAR(64)"))
+    
+    def create(self, persona_id: Optional[str] = None) -> str:
+        conversation_id = str(uuid.uuid4())
+        now = datetime.now()
+        self.hot.load(conversation_id, {
+            "messages": [], "persona_id": persona_id, "created_at": now, "last_updated": now
+        })
+        self._enqueue(conversations=[{
+            "id": conversation_id, "persona_id": persona_id, "created_at": now, "last_updated": now
+        }])
+        return conversation_id
+    
+    def append(self, conversation_id: str, message: ConversationMessage) -> int:
+        count = self.hot.append(conversation_id, message)
+        if not count and self._restore(conversation_id):
+            count = self.hot.append(conversation_id, message)
+        if not count:
+            return 0
+        self._enqueue(
+            messages=[{
+                "conversation_id": conversation_id,
+                "role": message.role.value,
+                "content": message.content,
+                "timestamp": message.timestamp,
+                "metadata": message.metadata
+            }],
+            touch=(conversation_id, datetime.now())
+        )
+        return count
+    
+    def get(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        conversation = self.hot.get(conversation_id)
+        if conversation is None and self._restore(conversation_id):
+            conversation = self.hot.get(conversation_id)
+        return conversation
+    
+    def get_persona_id(self, conversation_id: str) -> Optional[str]:
+        if self.hot.get(conversation_id) is None:
+            self._restore(conversation_id)
+        return self.hot.get_persona_id(conversation_id)
+    
+    def get_messages(self, conversation_id: str, limit: Optional[int] = None) -> List[ConversationMessage]:
+        messages = self.hot.get_messages(conversation_id, limit)
+        if messages or self.hot.get(conversation_id) is not None:
+            return messages
+        if self._restore(conversation_id):
+            return self.hot.get_messages(conversation_id, limit)
+        return []
+    
+    def purge_expired(self) -> int:
+        # Idle conversations leave the hot tier only; they remain in the database
+        return self.hot.purge_expired()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = len(self._pending_conversations) + len(self._pending_messages)
+        return {
+            **self.hot.stats(),
+            "backend": "sql",
+            "pending_writes": pending,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written
+        }
+    
+    async def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._flusher.join(timeout=5)
+        self._flush()
+        self.engine.dispose()
+    
+    def _restore(self, conversation_id: str) -> bool:
+        """Load a conversation evicted from the hot tier back from the database."""
+        miss_expiry = self._misses.get(conversation_id)
+        if miss_expiry is not None and miss_expiry > time.monotonic():
+            return False
+        
+        # Holding the flush lock means no batch is half-written: every row is
+        # either committed or still queued, so nothing needs flushing first
+        with self._flush_lock:
+            with self._cond:
+                pending_conversation = next(
+                    (c for c in self._pending_conversations if c["id"] == conversation_id), None
+                )
+                pending_messages = [
+                    m for m in self._pending_messages if m["conversation_id"] == conversation_id
+                ]
+            with self.engine.connect() as conn:
+                row = None
+                if pending_conversation is None:
+                    row = conn.execute(
+                        select(conversations_table).where(conversations_table.c.id == conversation_id)
+                    ).first()
+                    if row is None:
+                        self._misses.put(conversation_id, time.monotonic() + self.MISS_TTL_SECONDS)
+                        return False
+                message_rows = conn.execute(
+                    select(messages_table)
+                    .where(messages_table.c.conversation_id == conversation_id)
+                    .order_by(messages_table.c.id)
+                ).all() if row is not None else []
+        
+        source = row._mapping if row is not None else pending_conversation
+        self.hot.load(conversation_id, {
+            "messages": [
+                ConversationMessage(
+                    role=MessageRole(m["role"]),
+                    content=m["content"],
+                    timestamp=m["timestamp"],
+                    metadata=m["metadata"]
+                )
+                for m in [row._mapping for row in message_rows] + pending_messages
+            ],
+            "persona_id": source["persona_id"],
+            "created_at": source["created_at"],
+            "last_updated": datetime.now()
+        })
+        return True
+    
+    def _enqueue(self, conversations=(), messages=(), touch=None):
+        with self._cond:
+            self._pending_conversations.extend(conversations)
+            self._pending_messages.extend(messages)
+            if touch:
+                self._pending_touches[touch[0]] = touch[1]
+            if len(self._pending_conversations) + len(self._pending_messages) >= self.flush_batch_size:
+                self._cond.notify()
+    
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                if not self._closed:
+                    self._cond.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self._flush()
+            except Exception as e:
+                logger.error(f"Error flushing conversations: {e}")
+            if closed:
+                return
+    
+    def _flush(self):
+        """Write all queued rows in a single transaction."""
+        # Serialize flushes so batches are committed in the order they were queued
+        with self._flush_lock:
+            self._flush_pending()
+    
+    def _flush_pending(self):
+        with self._cond:
+            conversations, self._pending_conversations = self._pending_conversations, []
+            messages, self._pending_messages = self._pending_messages, []
+            touches, self._pending_touches = self._pending_touches, {}
+        if not (conversations or messages or touches):
+            return
+        try:
+            with self.engine.begin() as conn:
+                if conversations:
+                    conn.execute(conversations_table.insert(), conversations)
+                if messages:
+                    conn.execute(messages_table.insert(), messages)
+                if touches:
+                    conn.execute(
+                        update(conversations_table)
+                        .where(conversations_table.c.id == bindparam("b_id"))
+                        .values(last_updated=bindparam("b_last_updated")),
+                        [
+                            {"b_id": conversation_id, "b_last_updated": last_updated}
+                            for conversation_id, last_updated in touches.items()
+                        ]
+                    )
+        except Exception:
+            # Requeue so the next flush retries the batch
+            with self._cond:
+                self._pending_conversations[:0] = conversations
+                self._pending_messages[:0] = messages
+                for conversation_id, last_updated in touches.items():
+                    self._pending_touches.setdefault(conversation_id, last_updated)
+            raise
+        self.flushes += 1
+        self.rows_written += len(conversations) + len(messages)
@@ -0,0 +1,81 @@
+"""
+Startup bookkeeping: lazily built services, readiness and phase timings.
+"""
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class StartupState:
+    """Liveness/readiness flags and how long each startup phase took."""
+    
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.ready = False
+        self.error: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup phase under `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - started, 4)
+    
+    def mark(self, name: str):
+        """Record the time elapsed since process start as `name`."""
+        self.timings[name] = round(time.perf_counter() - self.started_at, 4)
+    
+    def mark_ready(self):
+        self.mark("ready")
+        self.ready = True
+        logger.info(f"Startup complete: {self.timings}")
+    
+    def mark_failed(self, error: Exception):
+        self.error = str(error)
+        logger.error(f"Startup warm-up failed: {error}")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Readiness and phase timings in seconds."""
+        return {
+            "ready": self.ready,
+            "error": self.error,
+            "timings": dict(self.timings)
+        }
+
+
+class LazyService(Generic[T]):
+    """Builds a service on first use, exactly once, recording the build time."""
+    
+    def __init__(self, name: str, factory: Callable[[], T], state: StartupState):
+        self.name = name
+        self._factory = factory
+        self._state = state
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def created(self) -> bool:
+        return self._instance is not None
+    
+    def get(self) -> T:
+        """The service instance, built on the first call."""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    with self._state.phase(self.name):
+                        self._instance = self._factory()
+        return self._instance
+    
+    async def get_async(self) -> T:
+        """Like get(), but any build happens in a worker thread so the event loop never blocks."""
+        if self._instance is not None:
+            return self._instance
+        return await asyncio.to_thread(self.get)
@@ -0,0 +1,26 @@
+"""
+Token counting helpers.
+"""
+from functools import lru_cache
+from loguru import logger
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken is optional; fall back to a character heuristic
+    _encoding = None
+    logger.info("tiktoken not available, estimating token counts from text length")
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """Count (or estimate) the number of tokens in `text`."""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return max(1, len(text) // 4) if text else 0
+
+
+def count_message_tokens(messages) -> int:
+    """Approximate prompt tokens for a list of chat messages."""
+    # ~4 tokens of framing per message plus 3 to prime the reply
+    return sum(count_tokens(message["content"]) + 4 for message in messages) + 3
@@ -0,0 +1,182 @@
+"""
+In-process vector index backed by a memory-mapped NumPy matrix.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+
+
+class _IndexState(NamedTuple):
+    """One consistent snapshot of the index; replaced as a whole, never mutated."""
+    matrix: np.ndarray
+    ids: List[str]
+    documents: List[str]
+    metadatas: List[Dict[str, Any]]
+    columns: Dict[str, np.ndarray]
+
+
+class NumpyVectorIndex:
+    """Drop-in for the subset of the Chroma collection API used by KnowledgeService.
+    
+    Embeddings are L2-normalized float32 rows of one contiguous matrix stored as
+    `embeddings.npy` and memory-mapped on load; ids, documents and metadata live
+    in `index.json`. A query is one matrix-vector product plus `argpartition`.
+    Distances are squared L2 between unit vectors (2 - 2 * cosine), matching
+    Chroma's default metric.
+    """
+    
+    def __init__(
+        self, 
+        directory: str, 
+        embed: Callable[[List[str]], Sequence[Sequence[float]]],
+        embed_query: Optional[Callable[[List[str]], Sequence[Sequence[float]]]] = None
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._embed = embed
+        # Queries may use an uncached embedder so one-off search text is not persisted
+        self._embed_query = embed_query or embed
+        self._lock = threading.Lock()
+        self._state = _IndexState(np.zeros((0, 0), dtype=np.float32), [], [], [], {})
+        self._load()
+    
+    @property
+    def _matrix_path(self) -> Path:
+        return self.directory / "embeddings.npy"
+    
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / "index.json"
+    
+    def count(self) -> int:
+        """Number of indexed chunks."""
+        return len(self._state.ids)
+    
+    def get(self, include: Optional[List[str]] = None, **_) -> Dict[str, Any]:
+        """IDs of all indexed chunks."""
+        return {"ids": list(self._state.ids)}
+    
+    def upsert(
+        self, 
+        ids: List[str], 
+        documents: List[str], 
+        metadatas: List[Dict[str, Any]], 
+        embeddings: Optional[Sequence[Sequence[float]]] = None
+    ):
+        """Insert or replace chunks, embedding `documents` in one batch unless `embeddings` are given."""
+        if embeddings is None:
+            embeddings = self._embed(documents)
+        vectors = self._normalize(np.asarray(embeddings, dtype=np.float32))
+        with self._lock:
+            state = self._state
+            positions = {chunk_id: i for i, chunk_id in enumerate(state.ids)}
+            matrix = np.array(state.matrix) if len(state.ids) else np.zeros((0, vectors.shape[1]), dtype=np.float32)
+            chunk_ids, chunk_docs, chunk_metas = list(state.ids), list(state.documents), list(state.metadatas)
+            appended = []
+            for vector, chunk_id, document, metadata in zip(vectors, ids, documents, metadatas):
+                if chunk_id in positions:
+                    i = positions[chunk_id]
+                    matrix[i] = vector
+                    chunk_docs[i], chunk_metas[i] = document, metadata
+                else:
+                    appended.append(vector)
+                    chunk_ids.append(chunk_id)
+                    chunk_docs.append(document)
+                    chunk_metas.append(metadata)
+            if appended:
+                matrix = np.vstack([matrix, np.stack(appended)])
+            self._persist(matrix, chunk_ids, chunk_docs, chunk_metas)
+    
+    def delete(self, ids: List[str]):
+        """Remove chunks by ID."""
+        drop = set(ids)
+        with self._lock:
+            state = self._state
+            keep = [i for i, chunk_id in enumerate(state.ids) if chunk_id not in drop]
+            self._persist(
+                np.ascontiguousarray(state.matrix[keep]) if keep else np.zeros((0, state.matrix.shape[1]), dtype=np.float32),
+                [state.ids[i] for i in keep],
+                [state.documents[i] for i in keep],
+                [state.metadatas[i] for i in keep]
+            )
+    
+    def query(self, query_texts: List[str], n_results: int = 5, where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Top-`n_results` chunks per query, optionally filtered by metadata equality."""
+        if n_results < 1:
+            raise ValueError(f"Number of requested results {n_results} must be a positive integer")
+        queries = self._normalize(np.asarray(self._embed_query(query_texts), dtype=np.float32))
+        # Read the state once so a concurrent reload cannot pair mismatched fields
+        state = self._state
+        matrix, ids, documents, metadatas = state.matrix, state.ids, state.documents, state.metadatas
+        
+        candidates = self._filter(state, where) if where else None
+        if candidates is not None:
+            matrix = matrix[candidates]
+        
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        for query in queries:
+            rows, scores = self._top_k(matrix, query, n_results)
+            if candidates is not None:
+                rows = candidates[rows]
+            result["ids"].append([ids[i] for i in rows])
+            result["documents"].append([documents[i] for i in rows])
+            result["metadatas"].append([metadatas[i] for i in rows])
+            result["distances"].append([float(2.0 - 2.0 * score) for score in scores])
+        return result
+    
+    @staticmethod
+    def _top_k(matrix: np.ndarray, query: np.ndarray, k: int):
+        if matrix.shape[0] == 0:
+            return np.array([], dtype=np.intp), np.array([], dtype=np.float32)
+        scores = matrix @ query
+        k = min(k, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return top, scores[top]
+    
+    @staticmethod
+    def _filter(state: _IndexState, where: Dict[str, Any]) -> np.ndarray:
+        """Row indices whose metadata equals every `where` value (plain or `$and` form)."""
+        if "$and" in where:
+            where = {field: value for condition in where["$and"] for field, value in condition.items()}
+        mask = np.ones(len(state.ids), dtype=bool)
+        for field, value in where.items():
+            column = state.columns.get(field)
+            if column is None:
+                return np.array([], dtype=np.intp)
+            mask &= column == value
+        return np.flatnonzero(mask)
+    
+    def _persist(self, matrix: np.ndarray, ids: List[str], documents: List[str], metadatas: List[Dict[str, Any]]):
+        """Atomically write the index and swap in a fresh memory map."""
+        tmp_matrix = self.directory / "embeddings.tmp.npy"
+        tmp_meta = self.directory / "index.tmp.json"
+        np.save(tmp_matrix, np.ascontiguousarray(matrix, dtype=np.float32))
+        with open(tmp_meta, "w") as f:
+            json.dump({"ids": ids, "documents": documents, "metadatas": metadatas}, f)
+        os.replace(tmp_matrix, self._matrix_path)
+        os.replace(tmp_meta, self._meta_path)
+        self._load()
+    
+    def _load(self):
+        if not (self._matrix_path.exists() and self._meta_path.exists()):
+            return
+        with open(self._meta_path) as f:
+            meta = json.load(f)
+        matrix = np.load(self._matrix_path, mmap_mode="r")
+        columns = {}
+        for field in {key for metadata in meta["metadatas"] for key in metadata}:
+            columns[field] = np.array([metadata.get(field) for metadata in meta["metadatas"]], dtype=object)
+        # Publish everything in one assignment so readers never see a half-swapped index
+        self._state = _IndexState(matrix, meta["ids"], meta["documents"], meta["metadatas"], columns)
+    
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
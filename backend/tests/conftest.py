@@ -0,0 +1,7 @@
+"""
+Make the backend modules importable as they are when running the app.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
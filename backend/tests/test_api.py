@@ -0,0 +1,129 @@
+"""
+Smoke tests for the FastAPI app: it imports and serves its basic routes.
+"""
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+_data_dir = tempfile.mkdtemp(prefix="ai-persona-test-")
+for name, value in {
+    "OPENAI_API_KEY": "test-key",
+    "SECRET_KEY": "test-secret",
+    "STARTUP_WARM_UP": "false",
+    "KNOWLEDGE_RELOAD_INTERVAL": "0",
+    "CONVERSATION_BACKEND": "memory",
+    "CHROMA_PERSIST_DIRECTORY": os.path.join(_data_dir, "chroma_db"),
+    "VECTOR_INDEX_DIRECTORY": os.path.join(_data_dir, "vector_index"),
+    "EMBEDDING_CACHE_DIR": os.path.join(_data_dir, "embedding_cache"),
+    "TTS_CACHE_DIR": os.path.join(_data_dir, "tts_cache"),
+}.items():
+    os.environ.setdefault(name, value)
+
+from fastapi.testclient import TestClient
+
+import main
+from models import ConversationMessage, MessageRole
+
+AUDIO = b"ID3" + bytes(range(256)) * 4
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def conversation(client):
+    """A conversation whose assistant reply already has cached audio."""
+    store = main._persona_registry.get().conversation_store
+    openai_service = main._openai_service.get()
+    reply = "I have five years of backend experience."
+    conversation_id = store.create(main.settings.default_persona)
+    store.append(conversation_id, ConversationMessage(role=MessageRole.USER, content="Tell me about yourself"))
+    store.append(conversation_id, ConversationMessage(role=MessageRole.ASSISTANT, content=reply))
+    openai_service.audio_cache.put(openai_service.audio_key(reply), AUDIO)
+    return conversation_id
+
+
+def test_health(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["services"]["database"] == "memory"
+
+
+def test_audio_full_body_and_revalidation(client, conversation):
+    response = client.get(f"/audio/{conversation}/1")
+    assert response.status_code == 200
+    assert response.content == AUDIO
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.headers["cache-control"] == "private, no-cache"
+    
+    etag = response.headers["etag"]
+    revalidated = client.get(f"/audio/{conversation}/1", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+
+
+def test_audio_range(client, conversation):
+    response = client.get(f"/audio/{conversation}/1", headers={"Range": "bytes=0-9"})
+    assert response.status_code == 206
+    assert response.content == AUDIO[:10]
+    assert response.headers["content-range"] == f"bytes 0-9/{len(AUDIO)}"
+
+
+def test_audio_missing_or_user_message(client, conversation):
+    assert client.get(f"/audio/{conversation}/0").status_code == 404
+    assert client.get(f"/audio/{conversation}/5").status_code == 404
+    assert client.get("/audio/does-not-exist/1").status_code == 404
+
+
+
+def test_expired_conversation_is_not_continued(client):
+    store = main._persona_registry.get().conversation_store
+    conversation_id = store.create(main.settings.default_persona)
+    # Simulate the idle TTL or LRU dropping it between turns
+    with store._lock:
+        del store._conversations[conversation_id]
+    
+    response = client.post("/conversation", json={"message": "Hello again", "conversation_id": conversation_id})
+    assert response.status_code == 404
+    assert client.get(f"/conversation/{conversation_id}").status_code == 404
+
+
+def _wav(seconds: float) -> bytes:
+    import io
+    import wave
+    
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        f.writeframes(b"\x00\x00" * int(16000 * seconds))
+    return buffer.getvalue()
+
+
+def test_transcribe_reads_the_spooled_upload(client, monkeypatch):
+    received = {}
+    
+    async def speech_to_text(audio_data, filename="audio.wav"):
+        received.update(size=len(audio_data), filename=filename)
+        return "hello there"
+    
+    monkeypatch.setattr(main._openai_service.get(), "speech_to_text", speech_to_text)
+    audio = _wav(1.0)
+    response = client.post("/voice/transcribe", files={"audio_file": ("clip.wav", audio, "audio/wav")})
+    assert response.status_code == 200
+    assert response.json()["text"] == "hello there"
+    assert received == {"size": len(audio), "filename": "clip.wav"}
+
+
+def test_transcribe_rejects_oversized_upload(client, monkeypatch):
+    monkeypatch.setattr(main.settings, "stt_max_upload_mb", 0)
+    response = client.post("/voice/transcribe", files={"audio_file": ("clip.wav", _wav(0.1), "audio/wav")})
+    assert response.status_code == 413
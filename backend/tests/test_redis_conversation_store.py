@@ -0,0 +1,69 @@
+"""
+RedisConversationStore against an in-process fake Redis.
+"""
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from models import ConversationMessage, MessageRole
+from services.redis_conversation_store import RedisConversationStore
+
+
+@pytest.fixture
+def store():
+    return RedisConversationStore(fakeredis.FakeRedis(decode_responses=True), ttl_seconds=60)
+
+
+def _message(content: str, role: MessageRole = MessageRole.USER) -> ConversationMessage:
+    return ConversationMessage(role=role, content=content)
+
+
+def test_append_and_read_back(store):
+    conversation_id = store.create()
+    assert store.append(conversation_id, _message("Hi")) == 1
+    assert store.append(conversation_id, _message("Hello!", MessageRole.ASSISTANT)) == 2
+    
+    messages = store.get_messages(conversation_id)
+    assert [m.content for m in messages] == ["Hi", "Hello!"]
+    assert messages[1].role == MessageRole.ASSISTANT
+    
+    conversation = store.get(conversation_id)
+    assert len(conversation["messages"]) == 2
+    assert conversation["last_updated"] >= conversation["created_at"]
+
+
+def test_get_messages_limit_returns_most_recent(store):
+    conversation_id = store.create()
+    for i in range(5):
+        store.append(conversation_id, _message(str(i)))
+    assert [m.content for m in store.get_messages(conversation_id, limit=2)] == ["3", "4"]
+
+
+def test_unknown_conversation(store):
+    assert store.append("missing", _message("Hi")) == 0
+    assert store.get("missing") is None
+    assert store.get_messages("missing") == []
+
+
+def test_writes_refresh_ttl(store):
+    conversation_id = store.create()
+    store.append(conversation_id, _message("Hi"))
+    assert 0 < store.client.ttl(store._meta_key(conversation_id)) <= 60
+    assert 0 < store.client.ttl(store._messages_key(conversation_id)) <= 60
+
+
+def test_stats_use_counters(store):
+    conversation_id = store.create()
+    store.append(conversation_id, _message("Hi"))
+    stats = store.stats()
+    assert stats["created"] == 1
+    assert stats["appended"] == 1
+
+
+def test_records_owning_persona(store):
+    owned = store.create("alice")
+    legacy = store.create()
+    assert store.get_persona_id(owned) == "alice"
+    assert store.get(owned)["persona_id"] == "alice"
+    assert store.get_persona_id(legacy) is None
+    assert store.get_persona_id("missing") is None